@@ -7,7 +7,10 @@ PANGAEA oceanographic databases.
 
 import logging
 import re
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import NamedTuple
 
 from cruiseplan.api.config import BathymetryDownloadConfig, PangaeaConfig
 from cruiseplan.api.types import BathymetryResult, PangaeaResult
@@ -16,6 +19,37 @@ from cruiseplan.config.exceptions import ValidationError
 logger = logging.getLogger(__name__)
 
 
+class DoiResolution(NamedTuple):
+    """DOIs resolved from a PANGAEA query and the files written while resolving."""
+
+    clean_dois: list[str] | None
+    generated_files: list[Path] | None
+
+
+@dataclass
+class PangaeaPaths:
+    """Validated search bounds and output locations for a PANGAEA run."""
+
+    bbox: tuple | None
+    """Search bounding box (min_lon, min_lat, max_lon, max_lat), if any"""
+
+    output_dir_path: Path
+    """Resolved output directory"""
+
+    base_name: str
+    """Base filename shared by all outputs"""
+
+    @cached_property
+    def dois_file(self) -> Path:
+        """Path of the intermediate DOI list."""
+        return self.output_dir_path / f"{self.base_name}_dois.txt"
+
+    @cached_property
+    def stations_file(self) -> Path:
+        """Path of the pickled stations data."""
+        return self.output_dir_path / f"{self.base_name}.pkl"
+
+
 def bathymetry_with_config(
     config: BathymetryDownloadConfig = None,
 ) -> BathymetryResult:
@@ -134,7 +168,7 @@ def _prepare_pangaea_config(
     output: str | None,
     lat_bounds: list[float] | None,
     lon_bounds: list[float] | None,
-) -> dict:
+) -> PangaeaPaths:
     """
     Validate inputs and prepare file paths configuration.
 
@@ -151,7 +185,7 @@ def _prepare_pangaea_config(
 
     Returns
     -------
-    dict
+    PangaeaPaths
         Configuration with validated bbox, paths, and filenames
     """
     from cruiseplan.api.init_utils import _validate_lat_lon_bounds
@@ -173,22 +207,10 @@ def _prepare_pangaea_config(
     else:
         base_name = output
 
-    # Define output files
-    dois_file = output_dir_path / f"{base_name}_dois.txt"
-    stations_file = output_dir_path / f"{base_name}.pkl"
-
-    return {
-        "bbox": bbox,
-        "output_dir_path": output_dir_path,
-        "base_name": base_name,
-        "dois_file": dois_file,
-        "stations_file": stations_file,
-    }
+    return PangaeaPaths(bbox=bbox, output_dir_path=output_dir_path, base_name=base_name)
 
 
-def _process_doi_file(
-    query_terms: str, dois_file: Path
-) -> tuple[list[str], list[Path]]:
+def _process_doi_file(query_terms: str, dois_file: Path) -> DoiResolution:
     """Process DOI file input mode."""
     import shutil
 
@@ -203,12 +225,10 @@ def _process_doi_file(
     generated_files = [dois_file]
     logger.info(f"📂 DOI file: {dois_file}")
 
-    return clean_dois, generated_files
+    return DoiResolution(clean_dois, generated_files)
 
 
-def _process_single_doi(
-    query_terms: str, dois_file: Path, manager
-) -> tuple[list[str], list[Path]]:
+def _process_single_doi(query_terms: str, dois_file: Path, manager) -> DoiResolution:
     """Process single DOI input mode."""
     logger.info(f"📄 Processing single DOI: '{query_terms}'")
 
@@ -226,7 +246,7 @@ def _process_single_doi(
     generated_files = [dois_file]
     logger.info(f"📂 DOI file: {dois_file}")
 
-    return clean_dois, generated_files
+    return DoiResolution(clean_dois, generated_files)
 
 
 def _process_search_query(
@@ -237,7 +257,7 @@ def _process_search_query(
     limit: int,
     dois_file: Path,
     manager,
-) -> tuple[list[str], list[Path]]:
+) -> DoiResolution:
     """Process search query input mode."""
     logger.info(f"🔍 Searching PANGAEA for: '{query_terms}'")
     if bbox:
@@ -249,10 +269,10 @@ def _process_search_query(
         pq = PanQuery(query_terms, bbox=bbox, limit=limit)
         if pq.error:
             logger.error(f"PANGAEA Query Error: {pq.error}")
-            return None, None
+            return DoiResolution(None, None)
 
         raw_dois = pq.get_dois()
-        clean_dois = [manager._clean_doi(doi) for doi in raw_dois]
+        clean_dois = manager._clean_dois(raw_dois)
 
         logger.info(
             f"Search found {pq.totalcount} total matches. Retrieving first {len(clean_dois)}..."
@@ -282,7 +302,7 @@ def _process_search_query(
         generated_files = [dois_file]
 
         logger.info(f"📂 DOI file: {dois_file}")
-        return clean_dois, generated_files
+        return DoiResolution(clean_dois, generated_files)
 
     except ImportError:
         logger.exception(
@@ -295,12 +315,12 @@ def _process_search_query(
 
 def _resolve_doi_list(
     query_terms: str,
-    config: dict,
+    config: PangaeaPaths,
     limit: int,
     manager,
     lat_bounds: list[float] | None,
     lon_bounds: list[float] | None,
-) -> tuple[list[str], list[Path]]:
+) -> DoiResolution:
     """
     Determine input type and get clean DOI list.
 
@@ -308,7 +328,7 @@ def _resolve_doi_list(
     ----------
     query_terms : str
         Input query terms, DOI, or file path
-    config : dict
+    config : PangaeaPaths
         Configuration from _prepare_pangaea_config
     limit : int
         Maximum number of results for search mode
@@ -319,11 +339,11 @@ def _resolve_doi_list(
 
     Returns
     -------
-    tuple[list[str], list[Path]]
+    DoiResolution
         Clean DOI list and generated files list
     """
-    bbox = config["bbox"]
-    dois_file = config["dois_file"]
+    bbox = config.bbox
+    dois_file = config.dois_file
 
     # Detect query_terms type and get DOI list accordingly
     query_path = Path(query_terms)
@@ -348,6 +368,7 @@ def _fetch_and_save_datasets(
     generated_files: list,
     rate_limit: float,
     merge_campaigns: bool,
+    manager,
 ) -> list:
     """
     Fetch detailed PANGAEA datasets and save to file.
@@ -364,13 +385,15 @@ def _fetch_and_save_datasets(
         API request rate limit
     merge_campaigns : bool
         Whether to merge campaigns with same name
+    manager : PangaeaManager
+        PANGAEA manager instance shared with the DOI resolution step
 
     Returns
     -------
     list
         Retrieved PANGAEA datasets
     """
-    from cruiseplan.data.pangaea import PangaeaManager, save_campaign_data
+    from cruiseplan.data.pangaea import save_campaign_data
 
     # Common processing for all modes - fetch detailed data
     logger.info(f"📂 Stations file: {stations_file}")
@@ -383,7 +406,6 @@ def _fetch_and_save_datasets(
     logger.info(f"⚙️ Processing {len(clean_dois)} DOIs...")
     logger.info(f"🕐 Rate limit: {rate_limit} requests/second")
 
-    manager = PangaeaManager()
     detailed_datasets = manager.fetch_datasets(
         clean_dois, rate_limit=rate_limit, merge_campaigns=merge_campaigns
     )
@@ -516,24 +538,29 @@ def pangaea(
         config = _prepare_pangaea_config(
             query_terms, output_dir, output, lat_bounds, lon_bounds
         )
-        stations_file = config["stations_file"]
+        stations_file = config.stations_file
 
         manager = PangaeaManager()
 
         # Get DOI list based on input type
-        clean_dois, generated_files = _resolve_doi_list(
+        resolution = _resolve_doi_list(
             query_terms, config, limit, manager, lat_bounds, lon_bounds
         )
 
         # Fetch and save detailed datasets
         detailed_datasets = _fetch_and_save_datasets(
-            clean_dois, stations_file, generated_files, rate_limit, merge_campaigns
+            resolution.clean_dois,
+            stations_file,
+            resolution.generated_files,
+            rate_limit,
+            merge_campaigns,
+            manager,
         )
 
         return _build_pangaea_result(
             query_terms,
             detailed_datasets,
-            generated_files,
+            resolution.generated_files,
             lat_bounds,
             lon_bounds,
             limit,
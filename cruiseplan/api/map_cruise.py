@@ -7,10 +7,14 @@ in various formats (PNG, KML).
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from cruiseplan.api.config import MapConfig
 from cruiseplan.api.types import MapResult
 
+if TYPE_CHECKING:
+    from cruiseplan.runtime.cruise import CruiseInstance
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,6 +96,7 @@ def map(
     verbose: bool = False,
     max_depth: int | None = None,
     include_eez: bool = False,
+    cruise: "CruiseInstance | None" = None,
 ) -> MapResult:
     """
     Generate cruise track map (mirrors: cruiseplan map).
@@ -138,6 +143,9 @@ def map(
         Enable verbose logging (default: False)
     include_eez : bool
         Overlay EEZ boundaries (visualization only; data downloaded on first use). Default is False.
+    cruise : CruiseInstance, optional
+        Already-loaded cruise for ``config_file`` (e.g. from ``EnrichResult.cruise``).
+        When given, the configuration file is not parsed again (default: None).
 
     Returns
     -------
@@ -165,12 +173,14 @@ def map(
 
     try:
         # Load cruise configuration - direct core call
-        cruise = CruiseInstance(Path(config_file))
+        if cruise is None:
+            cruise = CruiseInstance(Path(config_file))
 
         # Setup output paths using helper function
-        from cruiseplan.utils.io import setup_output_paths
+        from cruiseplan.utils.io import OutputPaths, setup_output_paths
 
         output_path, base_name = setup_output_paths(config_file, output_dir, output)
+        paths = OutputPaths(output_path, base_name)
 
         # Parse formats to generate
         formats = _parse_map_formats(format)
@@ -179,7 +189,7 @@ def map(
 
         # Generate maps based on format - direct core calls
         if "png" in formats:
-            png_file = output_path / f"{base_name}_map.png"
+            png_file = paths.map_png
             result = generate_map(
                 data_source=cruise,
                 source_type="cruise",
@@ -203,7 +213,7 @@ def map(
                 generated_files.append(result)
 
         if "kml" in formats:
-            kml_file = output_path / f"{base_name}_catalog.kml"
+            kml_file = paths.map_kml
             generate_kml_catalog(cruise.config, kml_file)
             generated_files.append(kml_file)
 
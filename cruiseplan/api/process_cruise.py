@@ -6,13 +6,17 @@ and process() functions that coordinate the full data processing pipeline.
 """
 
 import logging
+import os
+import re
 import warnings as python_warnings
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
+from ruamel.yaml.comments import CommentedMap
 
+from cruiseplan.api import map_cruise
 from cruiseplan.api.config import EnrichConfig, ProcessConfig, ValidateConfig
 from cruiseplan.api.types import EnrichResult, ProcessResult, ValidationResult
 from cruiseplan.config.exceptions import BathymetryError, FileError
@@ -34,6 +38,7 @@ from cruiseplan.config.values import (
 )
 from cruiseplan.config.yaml_io import load_yaml, load_yaml_safe, save_yaml
 from cruiseplan.data.bathymetry import BathymetryManager
+from cruiseplan.runtime.cruise import CruiseInstance
 from cruiseplan.runtime.validation import (
     check_complete_duplicates,
     check_cruise_metadata,
@@ -42,6 +47,12 @@ from cruiseplan.runtime.validation import (
     format_validation_warnings,
     validate_depth_accuracy,
 )
+from cruiseplan.utils.io import (
+    OutputPaths,
+    derive_base_name,
+    setup_output_paths,
+    validate_input_file,
+)
 from cruiseplan.utils.logging import configure_logging
 
 logger = logging.getLogger(__name__)
@@ -58,20 +69,106 @@ def _validation_warning_capture():
     Yields
     ------
     List[str]
-        List that will be populated with captured warning messages.
+        List that is populated with captured warning messages when the block
+        exits, including when it raises. The caller's warning filters apply.
     """
-    captured_warnings = []
+    captured_warnings: list[str] = []
 
-    def warning_handler(message, category, filename, lineno, file=None, line=None):
-        captured_warnings.append(str(message))
+    with python_warnings.catch_warnings(record=True) as recorded:
+        try:
+            yield captured_warnings
+        finally:
+            captured_warnings.extend(str(w.message) for w in recorded)
+
+
+# --- Enrichment Error Classification ---
+
+# Keyword patterns mapping low-level enrichment errors to cruiseplan
+# exceptions, checked in priority order (first match wins).
+_ENRICH_ERROR_CLASSES: tuple[tuple[re.Pattern[str], type[Exception], str], ...] = (
+    (
+        re.compile(r"validation|invalid|missing", re.IGNORECASE),
+        CruisePlanValidationError,
+        "Configuration validation failed",
+    ),
+    (
+        re.compile(r"bathymetry|etopo|gebco", re.IGNORECASE),
+        BathymetryError,
+        "Bathymetry processing failed",
+    ),
+    (
+        re.compile(r"file|directory|permission", re.IGNORECASE),
+        FileError,
+        "File operation failed",
+    ),
+)
+
+
+# --- Summary Metadata ---
+
+# Top-level ``cruise_name`` entry whose value is a complete quoted string
+# without escapes or embedded quotes, so the text between the quotes is
+# exactly what YAML would load. Plain scalars (which YAML may type as numbers
+# or null, or continue on the next line) and anything followed by an indented
+# line are left to the full parse.
+_CRUISE_NAME_HEADER_RE = re.compile(
+    rb"^cruise_name: +(?:'([^'\n\r]*)'|\"([^\"\\\n\r]*)\")"
+    rb"(?:[ \t]+#[^\n]*)?[ \t]*\r?\n(?![ \t])",
+    re.MULTILINE,
+)
 
-    old_showwarning = python_warnings.showwarning
-    python_warnings.showwarning = warning_handler
 
+def _read_cruise_name_header(path: Path, max_bytes: int = 4096) -> str | None:
+    """
+    Read ``cruise_name`` from the start of a YAML file without parsing it.
+
+    Parameters
+    ----------
+    path : Path
+        YAML configuration file.
+    max_bytes : int, optional
+        Number of leading bytes to scan (default: 4096).
+
+    Returns
+    -------
+    Optional[str]
+        The cruise name, or None if it is not a simple quoted entry near the
+        top of the file (callers should then fall back to a full parse).
+    """
     try:
-        yield captured_warnings
-    finally:
-        python_warnings.showwarning = old_showwarning
+        with open(path, "rb") as f:
+            head = f.read(max_bytes)
+    except OSError:
+        return None
+
+    match = _CRUISE_NAME_HEADER_RE.search(head)
+    if match is None:
+        return None
+    value = match.group(1) if match.group(1) is not None else match.group(2)
+    try:
+        return value.decode("utf-8") or None
+    except UnicodeDecodeError:
+        return None
+
+
+def _get_cruise_name(config_path: Path) -> str | None:
+    """
+    Get the cruise name for result summaries, parsing the file only if needed.
+
+    Parameters
+    ----------
+    config_path : Path
+        YAML configuration file.
+
+    Returns
+    -------
+    Optional[str]
+        The cruise name, or None if the configuration does not define one.
+    """
+    cruise_name = _read_cruise_name_header(config_path)
+    if cruise_name is None:
+        cruise_name = load_yaml_safe(config_path).get("cruise_name")
+    return cruise_name
 
 
 # --- Enrichment Functions ---
@@ -93,43 +190,39 @@ def _minimal_preprocess_config(config_dict: dict[str, Any]) -> dict[str, Any]:
     -------
     dict[str, Any]
         Minimally processed config dictionary ready for Cruise.from_dict().
+        The input is never modified: it is returned as-is when it already has
+        legs, otherwise a new dictionary is built.
     """
-    # Create a copy to avoid modifying original
-    processed_config = config_dict.copy()
-
     # Only add what's absolutely required for Pydantic validation to pass
     # Most defaults will be handled by Cruise object methods
 
-    # Ensure legs list exists (required by schema)
-    if "legs" not in processed_config:
-        processed_config["legs"] = []
-
-    # If no legs and no ports, add minimal default leg for validation
-    if not processed_config["legs"]:
-        departure_port = processed_config.get(
-            DEPARTURE_PORT_FIELD, DEFAULT_DEPARTURE_PORT
-        )
-        arrival_port = processed_config.get(ARRIVAL_PORT_FIELD, DEFAULT_ARRIVAL_PORT)
-
-        processed_config["legs"] = [
-            {
-                "name": DEFAULT_LEG_NAME,
-                DEPARTURE_PORT_FIELD: departure_port,
-                ARRIVAL_PORT_FIELD: arrival_port,
-            }
-        ]
-
-        # Remove global ports since they're now in the leg
-        processed_config.pop(DEPARTURE_PORT_FIELD, None)
-        processed_config.pop(ARRIVAL_PORT_FIELD, None)
+    # Legs present: nothing to do, no copy needed
+    if config_dict.get("legs"):
+        return config_dict
+
+    # No legs (missing or empty): add a minimal default leg for validation,
+    # moving the global ports into it
+    departure_port = config_dict.get(DEPARTURE_PORT_FIELD, DEFAULT_DEPARTURE_PORT)
+    arrival_port = config_dict.get(ARRIVAL_PORT_FIELD, DEFAULT_ARRIVAL_PORT)
+    default_leg = {
+        "name": DEFAULT_LEG_NAME,
+        DEPARTURE_PORT_FIELD: departure_port,
+        ARRIVAL_PORT_FIELD: arrival_port,
+    }
 
+    processed_config = {
+        key: value
+        for key, value in config_dict.items()
+        if key not in (DEPARTURE_PORT_FIELD, ARRIVAL_PORT_FIELD)
+    }
+    processed_config["legs"] = [default_leg]
     return processed_config
 
 
 def _save_config(
     config_dict: dict[str, Any],
     output_path: Path | None,
-) -> None:
+) -> int:
     """
     Save configuration to file with section comments.
 
@@ -139,11 +232,14 @@ def _save_config(
         Configuration dictionary to save.
     output_path : Optional[Path]
         Path for output file (if None, no save).
+
+    Returns
+    -------
+    int
+        Number of bytes written (0 when nothing was saved).
     """
     if output_path:
         # Add section comments to the config before saving
-        from ruamel.yaml.comments import CommentedMap
-
         commented_data = CommentedMap(config_dict)
 
         # Add cruise metadata comment before first field
@@ -165,7 +261,8 @@ def _save_config(
                     key, before="\nSchedule organization"
                 )
 
-        save_yaml(commented_data, output_path, backup=False)
+        return save_yaml(commented_data, output_path, backup=False)
+    return 0
 
 
 def _process_warnings(captured_warnings: list[str]) -> None:
@@ -178,15 +275,42 @@ def _process_warnings(captured_warnings: list[str]) -> None:
         List of captured warning messages.
     """
     if captured_warnings:
-        logger.warning("⚠️ Configuration Warnings:")
-        for warning in captured_warnings:
-            for line in warning.split("\n"):
-                if line.strip():
-                    logger.warning(f"  {line}")
-        logger.warning("")  # Add spacing between warning groups
+        # One log record for the whole block, with a trailing blank line
+        # for spacing between warning groups
+        lines = "\n".join(
+            f"  {line}"
+            for warning in captured_warnings
+            for line in warning.split("\n")
+            if line.strip()
+        )
+        logger.warning("⚠️ Configuration Warnings:\n%s\n", lines)
 
 
-def _enrich_configuration(
+def _is_output_permission_error(exc: BaseException, output_dir: Path) -> bool:
+    """
+    Check whether an error is a permission failure on a path in ``output_dir``.
+
+    Parameters
+    ----------
+    exc : BaseException
+        Error raised during enrichment; its direct cause is also checked.
+    output_dir : Path
+        Directory the enriched configuration is written to.
+
+    Returns
+    -------
+    bool
+        True if ``exc`` (or its cause) is a PermissionError whose filename
+        lies inside ``output_dir``.
+    """
+    for err in (exc, exc.__cause__):
+        if isinstance(err, PermissionError) and err.filename is not None:
+            path = Path(os.fsdecode(err.filename)).resolve()
+            return path.is_relative_to(output_dir.resolve())
+    return False
+
+
+def _enrich_cruise(
     config_path: Path,
     add_depths: bool = False,
     add_coords: bool = False,
@@ -195,7 +319,8 @@ def _enrich_configuration(
     bathymetry_dir: str = "data/bathymetry",
     coord_format: str = "ddm",
     output_path: Path | None = None,
-) -> dict[str, Any]:
+    config_dict: dict[str, Any] | None = None,
+) -> tuple[CruiseInstance, dict[str, Any]]:
     """
     Add missing data to cruise configuration.
 
@@ -219,28 +344,31 @@ def _enrich_configuration(
         Coordinate format ("ddm" or "dms", default: "ddm").
     output_path : Optional[Path], optional
         Path for output file (if None, modifies in place).
+    config_dict : Optional[dict[str, Any]], optional
+        Already-parsed contents of ``config_path``. When given, the file is
+        not read again.
 
     Returns
     -------
-    Dict[str, Any]
-        Dictionary with enrichment summary containing:
+    tuple[CruiseInstance, dict[str, Any]]
+        The enriched cruise and a dictionary with enrichment summary containing:
         - stations_with_depths_added: Number of depths added
         - stations_with_coords_added: Number of coordinates added
         - sections_expanded: Number of CTD sections expanded
         - stations_from_expansion: Number of stations generated from expansion
         - total_stations_processed: Total stations processed
+        - output_size_bytes: Size of the saved output file (0 if not saved)
     """
     # === Clean Architecture: Minimal preprocessing → Cruise enhancement phase ===
 
-    # 1. Load raw YAML
-    config_dict = load_yaml(config_path)
+    # 1. Load raw YAML (unless the caller already parsed it)
+    if config_dict is None:
+        config_dict = load_yaml(config_path)
 
     # 2. Minimal preprocessing (only what's required for Pydantic validation)
     processed_config = _minimal_preprocess_config(config_dict)
 
     # 3. Create Cruise object
-    from cruiseplan.runtime.cruise import CruiseInstance
-
     with _validation_warning_capture() as captured_warnings:
         cruise = CruiseInstance.from_dict(processed_config)
 
@@ -255,7 +383,7 @@ def _enrich_configuration(
     # Add station defaults (like mooring durations)
     station_defaults_added = cruise.add_station_defaults()
 
-    stations_with_depths_added = set()
+    stations_with_depths_added = 0
     if add_depths:
         stations_with_depths_added = cruise.enrich_depths(
             bathymetry_source, bathymetry_dir
@@ -276,7 +404,7 @@ def _enrich_configuration(
     final_summary = {
         "sections_expanded": sections_expanded,
         "stations_from_expansion": stations_from_expansion,
-        "stations_with_depths_added": len(stations_with_depths_added),
+        "stations_with_depths_added": stations_with_depths_added,
         "stations_with_coords_added": coord_changes_made,
         "station_defaults_added": station_defaults_added,
         "total_stations_processed": len(cruise.point_registry),
@@ -284,9 +412,46 @@ def _enrich_configuration(
 
     # Process warnings and save configuration
     _process_warnings(captured_warnings)
-    _save_config(output_config, output_path)
+    final_summary["output_size_bytes"] = _save_config(output_config, output_path)
+
+    # Enrichment updates the registries rather than the validated config, so
+    # rebuild from the written dict to match what loading the output gives
+    return CruiseInstance.from_dict(output_config), final_summary
+
+
+def _enrich_configuration(
+    config_path: Path,
+    add_depths: bool = False,
+    add_coords: bool = False,
+    expand_sections: bool = False,
+    bathymetry_source: str = "gebco2025",
+    bathymetry_dir: str = "data/bathymetry",
+    coord_format: str = "ddm",
+    output_path: Path | None = None,
+    config_dict: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Add missing data to cruise configuration and return only the summary.
+
+    See ``_enrich_cruise`` for parameters and the summary contents.
 
-    return final_summary
+    Returns
+    -------
+    Dict[str, Any]
+        Enrichment summary dictionary.
+    """
+    _, summary = _enrich_cruise(
+        config_path,
+        add_depths=add_depths,
+        add_coords=add_coords,
+        expand_sections=expand_sections,
+        bathymetry_source=bathymetry_source,
+        bathymetry_dir=bathymetry_dir,
+        coord_format=coord_format,
+        output_path=output_path,
+        config_dict=config_dict,
+    )
+    return summary
 
 
 def enrich_with_config(
@@ -416,8 +581,6 @@ def enrich(  # noqa: C901
             logger.debug("Verbose logging enabled")
 
         # Validate input file path using centralized utility
-        from cruiseplan.utils.io import validate_input_file
-
         try:
             config_path = validate_input_file(config_file)
         except ValueError as e:
@@ -430,32 +593,17 @@ def enrich(  # noqa: C901
         except Exception as e:
             raise CruisePlanValidationError(f"Invalid YAML configuration: {e}")
 
-        # Setup and validate output paths
+        # Setup and validate output paths (creates the directory if needed);
+        # an unwritable directory surfaces when the enriched file is saved
         try:
-            from cruiseplan.utils.io import setup_output_paths
-
             output_dir_path, base_name = setup_output_paths(
                 config_file, output_dir, output
             )
-
-            # Create output directory if needed
-            output_dir_path.mkdir(parents=True, exist_ok=True)
-
-            # Test directory writability
-            test_file = output_dir_path / ".tmp_write_test"
-            try:
-                test_file.touch()
-                test_file.unlink()
-            except Exception:
-                raise FileError(f"Output directory is not writable: {output_dir_path}")
-
         except Exception as e:
-            if isinstance(e, FileError):
-                raise
             raise FileError(f"Output directory setup failed: {e}")
 
         # Determine final output file path
-        output_path = output_dir_path / f"{base_name}_enriched.yaml"
+        output_path = OutputPaths(output_dir_path, base_name).enriched
 
         logger.info(f"🔧 Enriching {config_path}")
         if verbose:
@@ -467,7 +615,7 @@ def enrich(  # noqa: C901
 
         # Perform the actual enrichment
         try:
-            summary = _enrich_configuration(
+            cruise, summary = _enrich_cruise(
                 config_path,
                 output_path=output_path,
                 add_depths=add_depths,
@@ -476,38 +624,19 @@ def enrich(  # noqa: C901
                 bathymetry_source=bathy_source,
                 bathymetry_dir=bathy_dir,
                 coord_format=coord_format,
+                config_dict=config_data,
             )
 
         except Exception as e:
             # Convert low-level errors to appropriate high-level exceptions
-            error_msg = str(e).lower()
-            if (
-                "validation" in error_msg
-                or "invalid" in error_msg
-                or "missing" in error_msg
-            ):
-                raise CruisePlanValidationError(f"Configuration validation failed: {e}")
-            elif (
-                "bathymetry" in error_msg
-                or "etopo" in error_msg
-                or "gebco" in error_msg
-            ):
-                raise BathymetryError(f"Bathymetry processing failed: {e}")
-            elif (
-                "file" in error_msg
-                or "directory" in error_msg
-                or "permission" in error_msg
-            ):
-                raise FileError(f"File operation failed: {e}")
-            else:
-                # Re-raise as generic error for now
-                raise
-
-        # Verify output was created successfully
-        if not output_path.exists():
-            raise FileError(
-                f"Enrichment completed but output file was not created: {output_path}"
-            )
+            if _is_output_permission_error(e, output_dir_path):
+                raise FileError(f"Output directory is not writable: {output_dir_path}")
+            error_msg = str(e)
+            for pattern, error_cls, prefix in _ENRICH_ERROR_CLASSES:
+                if pattern.search(error_msg):
+                    raise error_cls(f"{prefix}: {e}")
+            # Re-raise as generic error for now
+            raise
 
         # Generate extended summary information
         extended_summary = {
@@ -518,8 +647,7 @@ def enrich(  # noqa: C901
                 "add_coords": add_coords,
                 "expand_sections": expand_sections,
             },
-            "output_size_bytes": output_path.stat().st_size,
-            **summary,  # Include detailed summary from _enrich_configuration
+            **summary,  # Detailed summary from _enrich_cruise, incl. output_size_bytes
         }
 
         logger.info(f"✅ Configuration enriched successfully: {output_path}")
@@ -528,6 +656,7 @@ def enrich(  # noqa: C901
             output_file=output_path,
             files_created=[output_path],
             summary=extended_summary,
+            cruise=cruise,
         )
 
     except (CruisePlanValidationError, FileError, BathymetryError):
@@ -589,9 +718,6 @@ def _validate_configuration(
     python_warnings.showwarning = warning_handler
 
     try:
-        # Import here to avoid circular dependencies
-        from cruiseplan.runtime.cruise import CruiseInstance
-
         # Load and validate configuration
         cruise = CruiseInstance(config_path)
 
@@ -969,8 +1095,6 @@ def validate(
     configure_logging(verbose)
 
     # Validate input file path using centralized utility
-    from cruiseplan.utils.io import validate_input_file
-
     try:
         config_path = validate_input_file(config_file)
     except ValueError as e:
@@ -996,9 +1120,9 @@ def validate(
 
         # Try to add cruise name to summary if available
         try:
-            config_dict = load_yaml_safe(config_path)
-            if "cruise_name" in config_dict:
-                summary["cruise_name"] = config_dict["cruise_name"]
+            cruise_name = _get_cruise_name(config_path)
+            if cruise_name is not None:
+                summary["cruise_name"] = cruise_name
         except Exception:
             # Best-effort enrichment: failure to read cruise_name should not break validation
             pass
@@ -1217,14 +1341,15 @@ def process(
 
     logger.info(f"🚀 Processing cruise configuration: {config_file}")
 
-    from cruiseplan.utils.io import validate_input_file
-
     # Validate input file
     try:
         config_path = validate_input_file(config_file)
     except ValueError as e:
         raise FileError(str(e))
 
+    # Name the enriched config once so enrich() need not re-read it for the name
+    base_name = derive_base_name(config_path, output)
+
     generated_files = []
     validation_result = None
 
@@ -1235,7 +1360,7 @@ def process(
             enrich_result = enrich(
                 config_file=config_file,
                 output_dir=output_dir,
-                output=output,
+                output=base_name,
                 add_depths=add_depths,
                 add_coords=add_coords,
                 expand_sections=expand_sections,
@@ -1270,12 +1395,10 @@ def process(
         if run_map_generation:
             logger.info("🗺️ Generating cruise maps...")
 
-            # Import here to avoid circular import
-            from cruiseplan.api.map_cruise import map
-
-            map_result = map(
+            map_result = map_cruise.map(
                 config_file=enriched_config_path,  # Use enriched config if available
                 output_dir=output_dir,
+                # Without cruise_name, maps are named after the enriched file
                 output=output,
                 format=format,
                 bathy_source=bathy_source,
@@ -1292,13 +1415,13 @@ def process(
                 verbose=verbose,
                 max_depth=max_depth,
                 include_eez=include_eez,
+                cruise=enrich_result.cruise,
             )
             generated_files.extend(map_result.map_files)
 
         # Load config metadata for summary
         try:
-            config_dict = load_yaml_safe(config_path)
-            cruise_name = config_dict.get("cruise_name", "Unknown")
+            cruise_name = _get_cruise_name(config_path) or "Unknown"
         except Exception:
             cruise_name = "Unknown"
 
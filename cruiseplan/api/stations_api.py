@@ -10,6 +10,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from cruiseplan.api.config import StationsConfig
 from cruiseplan.api.types import BaseResult
 from cruiseplan.config.cruise_config import CruiseConfig
@@ -29,6 +31,8 @@ logger = logging.getLogger(__name__)
 class StationPickerResult(BaseResult):
     """Result object for station picker operations."""
 
+    __slots__ = ("output_file", "pangaea_data")
+
     def __init__(
         self,
         output_file: Path,
@@ -48,6 +52,41 @@ class StationPickerResult(BaseResult):
         return f"Interactive station picker completed - output: {self.output_file}"
 
 
+def _campaign_extent(campaign_data: list[dict], key: str) -> tuple[float, float] | None:
+    """
+    Combined (min, max) of one coordinate across all campaigns.
+
+    Each campaign's values are reduced with NumPy and only the per-campaign
+    extremes are combined, so no merged list of all stations is built.
+    Missing values (NaN) in PANGAEA data are ignored.
+
+    Parameters
+    ----------
+    campaign_data : list
+        Loaded PANGAEA campaign data
+    key : str
+        Coordinate key, "latitude" or "longitude"
+
+    Returns
+    -------
+    tuple of float or None
+        (min, max) over all campaigns, or None if no campaign has values
+    """
+    extent = None
+    for campaign in campaign_data:
+        values = np.asarray(campaign.get(key, []), dtype=np.float64)
+        if values.size == 0:
+            continue
+        # fmin/fmax skip NaN and only return NaN if every value is missing
+        low, high = float(np.fmin.reduce(values)), float(np.fmax.reduce(values))
+        if np.isnan(low):
+            continue
+        if extent is not None:
+            low, high = min(low, extent[0]), max(high, extent[1])
+        extent = (low, high)
+    return extent
+
+
 def determine_coordinate_bounds(
     lat_bounds: tuple[float, float] | None = None,
     lon_bounds: tuple[float, float] | None = None,
@@ -92,20 +131,18 @@ def determine_coordinate_bounds(
 
     # Try to derive bounds from PANGAEA data (third priority)
     if campaign_data:
-        all_lats = []
-        all_lons = []
+        lat_extent = _campaign_extent(campaign_data, "latitude")
+        lon_extent = _campaign_extent(campaign_data, "longitude")
 
-        for campaign in campaign_data:
-            all_lats.extend(campaign.get("latitude", []))
-            all_lons.extend(campaign.get("longitude", []))
+        if lat_extent and lon_extent:
+            (lat_min, lat_max), (lon_min, lon_max) = lat_extent, lon_extent
 
-        if all_lats and all_lons:
             # Add some padding
-            lat_padding = (max(all_lats) - min(all_lats)) * 0.1
-            lon_padding = (max(all_lons) - min(all_lons)) * 0.1
+            lat_padding = (lat_max - lat_min) * 0.1
+            lon_padding = (lon_max - lon_min) * 0.1
 
-            lat_bounds_calc = (min(all_lats) - lat_padding, max(all_lats) + lat_padding)
-            lon_bounds_calc = (min(all_lons) - lon_padding, max(all_lons) + lon_padding)
+            lat_bounds_calc = (lat_min - lat_padding, lat_max + lat_padding)
+            lon_bounds_calc = (lon_min - lon_padding, lon_max + lon_padding)
 
             logger.info(
                 f"Using bounds from PANGAEA data: Lat: {lat_bounds_calc[0]:.2f}° to {lat_bounds_calc[1]:.2f}°, Lon: {lon_bounds_calc[0]:.2f}° to {lon_bounds_calc[1]:.2f}°"
@@ -126,7 +163,8 @@ def load_pangaea_campaign_data(pangaea_file: Path) -> list[dict]:
     """
     Load PANGAEA campaign data from pickle file with validation and summary.
 
-    Moved from cli_utils.py with no changes to logic.
+    Moved from cli_utils.py. Campaigns are merged per label, so their latitudes
+    and longitudes are float64 NumPy arrays (see ``merge_campaign_tracks``).
 
     Parameters
     ----------
@@ -198,7 +236,7 @@ def load_config_stations_data(
     try:
         # Load and validate the YAML configuration
         raw_data = load_yaml(config_file)
-        config = CruiseConfig(**raw_data)
+        config = CruiseConfig.model_validate(raw_data)
 
         # Extract stations from points catalog
         stations_data = []
@@ -504,16 +542,10 @@ def stations(
             custom_contours=bathy_contours,
             overwrite=overwrite,
             max_depth=max_depth,
+            xlim=final_lon_bounds,
+            ylim=final_lat_bounds,
         )
 
-        # Set coordinate bounds (unchanged from cli/stations.py)
-        picker.ax_map.set_xlim(final_lon_bounds)
-        picker.ax_map.set_ylim(final_lat_bounds)
-        picker._update_aspect_ratio()
-
-        # Re-plot bathymetry with correct bounds
-        picker._plot_bathymetry()
-
         # Show the interactive interface (blocking call)
         picker.show()
 
@@ -5,11 +5,14 @@ Provides structured return types for all main API operations.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Import the CruiseSchedule type from timeline
 from cruiseplan.timeline import CruiseSchedule
 
+if TYPE_CHECKING:
+    from cruiseplan.runtime.cruise import CruiseInstance
+
 
 class BaseResult:
     """Base class for all CruisePlan API result types.
@@ -19,6 +22,8 @@ class BaseResult:
     tracking is included in the base class.
     """
 
+    __slots__ = ("_success_indicator", "errors", "files_created", "summary", "warnings")
+
     def __init__(
         self,
         summary: dict[str, Any],
@@ -82,13 +87,21 @@ class BaseResult:
 class EnrichResult(BaseResult):
     """Structured result from enrich operation."""
 
+    __slots__ = ("cruise", "output_file")
+
     def __init__(
-        self, output_file: Path, files_created: list[Path], summary: dict[str, Any]
+        self,
+        output_file: Path,
+        files_created: list[Path],
+        summary: dict[str, Any],
+        cruise: "CruiseInstance | None" = None,
     ):
         super().__init__(
             summary=summary, success_indicator=output_file, files_created=files_created
         )
         self.output_file = output_file  # Keep for backward compatibility
+        # In-memory enriched cruise, so callers need not re-read output_file
+        self.cruise = cruise
 
     @property
     def _operation_name(self) -> str:
@@ -98,6 +111,8 @@ class EnrichResult(BaseResult):
 class ValidationResult(BaseResult):
     """Structured result from validate operation."""
 
+    __slots__ = ("success",)
+
     def __init__(
         self,
         success: bool,
@@ -122,6 +137,8 @@ class ValidationResult(BaseResult):
 class ScheduleResult(BaseResult):
     """Structured result from schedule operation."""
 
+    __slots__ = ("timeline",)
+
     def __init__(
         self,
         timeline: CruiseSchedule | None,
@@ -145,6 +162,8 @@ class ScheduleResult(BaseResult):
 class PangaeaResult(BaseResult):
     """Structured result from pangaea operation."""
 
+    __slots__ = ("stations_data",)
+
     def __init__(
         self,
         stations_data: Any | None,
@@ -171,6 +190,8 @@ class PangaeaResult(BaseResult):
 class ProcessResult(BaseResult):
     """Structured result from process operation."""
 
+    __slots__ = ("config",)
+
     def __init__(
         self,
         config: Any | None,
@@ -196,6 +217,8 @@ class ProcessResult(BaseResult):
 class MapResult(BaseResult):
     """Structured result from map operation."""
 
+    __slots__ = ("format", "map_files")
+
     def __init__(self, map_files: list[Path], format: str, summary: dict[str, Any]):
         super().__init__(
             summary=summary,
@@ -213,6 +236,8 @@ class MapResult(BaseResult):
 class BathymetryResult(BaseResult):
     """Structured result from bathymetry operation."""
 
+    __slots__ = ("data_file", "source")
+
     def __init__(self, data_file: Path | None, source: str, summary: dict[str, Any]):
         # Convert single file to list for consistency
         files_created = [data_file] if data_file else []
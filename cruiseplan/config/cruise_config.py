@@ -7,9 +7,17 @@ configuration file. This is the top-level YAML structure that contains
 all cruise metadata, global catalog definitions, and schedule organization.
 """
 
+from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 from cruiseplan.config.values import (
     DEFAULT_CTD_RATE_M_S,
@@ -354,6 +362,45 @@ class CruiseConfig(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    # Last parsed start, keyed by the (start_date, start_time) it came from
+    _start_datetime_cache: tuple[tuple[str, str | None], datetime] | None = PrivateAttr(
+        default=None
+    )
+
+    @property
+    def start_datetime(self) -> datetime:
+        """
+        Cruise start as a naive datetime.
+
+        ``start_date`` is either an ISO timestamp (a trailing ``Z`` or
+        ``+00:00`` is dropped) or a ``YYYY-MM-DD`` date combined with
+        ``start_time``. The parsed value is reused until either field changes.
+
+        Returns
+        -------
+        datetime
+            Parsed cruise start.
+
+        Raises
+        ------
+        ValueError
+            If ``start_date`` and ``start_time`` cannot be parsed.
+        """
+        key = (self.start_date, self.start_time)
+        cached = self._start_datetime_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if "T" in self.start_date:
+            start_date = self.start_date.replace("Z", "").replace("+00:00", "")
+            start = datetime.fromisoformat(start_date)
+        else:
+            start = datetime.strptime(
+                f"{self.start_date} {self.start_time}", "%Y-%m-%d %H:%M"
+            )
+        self._start_datetime_cache = (key, start)
+        return start
+
     @model_validator(mode="after")
     def validate_cruise_structure(self):
         """
@@ -20,6 +20,7 @@ enrichment operations.
 """
 
 import logging
+import shutil
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -28,6 +29,13 @@ from ruamel.yaml.error import YAMLError
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for YAML input; configs are read in a single sequential read
+# instead of ruamel.yaml pulling small chunks from a text stream.
+_YAML_READ_BUFFER = 1 << 20
+
+# Write buffer for YAML output; the emitter streams encoded bytes into it.
+_YAML_WRITE_BUFFER = 1 << 20
+
 
 class YAMLIOError(Exception):
     """Custom exception for YAML I/O operations."""
@@ -60,6 +68,22 @@ def _get_yaml_processor(preserve_quotes: bool = True, width: int = 4096) -> YAML
     return yaml
 
 
+def _read_yaml_text(file_path: Path, encoding: str = "utf-8") -> str:
+    """
+    Read a YAML file in one buffered binary read and decode it.
+
+    Args:
+        file_path: Path to YAML file
+        encoding: File encoding
+
+    Returns
+    -------
+        Decoded file contents
+    """
+    with open(file_path, "rb", buffering=_YAML_READ_BUFFER) as f:
+        return f.read().decode(encoding)
+
+
 def load_yaml(file_path: str | Path, encoding: str = "utf-8") -> dict[str, Any]:
     """
     Load YAML configuration file with comment preservation.
@@ -86,8 +110,7 @@ def load_yaml(file_path: str | Path, encoding: str = "utf-8") -> dict[str, Any]:
 
     try:
         yaml = _get_yaml_processor()
-        with open(file_path, encoding=encoding) as f:
-            config = yaml.load(f)
+        config = yaml.load(_read_yaml_text(file_path, encoding))
 
         if config is None:
             raise YAMLIOError(f"YAML file is empty: {file_path}")
@@ -132,7 +155,7 @@ def save_yaml(
     file_path: str | Path,
     backup: bool = False,
     encoding: str = "utf-8",
-) -> None:
+) -> int:
     """
     Save configuration to YAML file with comment preservation.
 
@@ -142,6 +165,10 @@ def save_yaml(
         backup: Whether to create backup of existing file
         encoding: File encoding
 
+    Returns
+    -------
+        Number of bytes written
+
     Raises
     ------
         YAMLIOError: If file cannot be written
@@ -152,20 +179,22 @@ def save_yaml(
         # Create backup if requested and file exists
         if backup and file_path.exists():
             backup_path = _get_incremental_backup_path(file_path)
-            backup_path.write_text(
-                file_path.read_text(encoding=encoding), encoding=encoding
-            )
+            shutil.copyfile(file_path, backup_path)
             logger.info(f"Created backup: {backup_path}")
 
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write YAML file with comment preservation
+        # Stream YAML with comment preservation straight into a binary file;
+        # ruamel.yaml encodes as it emits, so no full document string is built
         yaml = _get_yaml_processor()
-        with open(file_path, "w", encoding=encoding) as f:
+        yaml.encoding = encoding
+        with open(file_path, "wb", buffering=_YAML_WRITE_BUFFER) as f:
             yaml.dump(config, f)
+            size = f.tell()
 
         logger.info(f"Saved configuration to: {file_path}")
+        return size
 
     except Exception as e:
         raise YAMLIOError(f"Error writing {file_path}: {e}") from e
@@ -198,6 +227,10 @@ def load_yaml_safe(file_path: str | Path) -> dict[str, Any]:
     Returns a plain Python dictionary instead of ruamel.yaml's CommentedMap.
     Use load_yaml() for comment-preserving operations.
 
+    Unlike the round-trip loader, the safe loader uses the libyaml C parser
+    when it is installed (``ruamel.yaml[libyaml]``), so prefer this function
+    when only the values are needed.
+
     Args:
         file_path: Path to YAML file
 
@@ -214,10 +247,10 @@ def load_yaml_safe(file_path: str | Path) -> dict[str, Any]:
     file_path = Path(file_path)
 
     try:
-        yaml = YAML(typ="safe")  # Use safe mode, returns plain Python objects
+        # Safe mode returns plain Python objects and uses libyaml when installed
+        yaml = YAML(typ="safe")
         yaml.sort_keys = False  # type: ignore[attr-defined] # Preserve insertion order
-        with open(file_path, encoding="utf-8") as f:
-            config = yaml.load(f)
+        config = yaml.load(_read_yaml_text(file_path))
 
         if config is None:
             raise YAMLIOError(f"YAML file is empty: {file_path}")
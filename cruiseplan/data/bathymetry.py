@@ -6,6 +6,7 @@ bathymetry data from ETOPO datasets for depth lookups.
 """
 
 import logging
+import os
 import shutil
 import zipfile
 from pathlib import Path
@@ -41,10 +42,23 @@ MSM142_JJ_NC_FILENAME = "MSM142_bathyJJ.nc"
 MSM142_DT_NC_FILENAME = "MSM142_bathyDT.nc"
 MSM142_LEGACY_NC_FILENAME = "msm142.nc"  # Legacy filename
 
+# Grid subset cache: subdirectory of data_dir for .npy files, and how many to keep
+GRID_CACHE_DIRNAME = "grid_cache"
+GRID_CACHE_MAX_FILES = 20
+
 # Constants from Spec
 DEPTH_CONTOURS = [-5000, -4000, -3000, -2000, -1000, -750, -500, -200, -100, -50, 0]
 
 
+def _prune_grid_cache(cache_dir: Path, max_files: int = GRID_CACHE_MAX_FILES) -> None:
+    """Delete all but the ``max_files`` most recently used grid cache files."""
+    files = sorted(
+        cache_dir.glob("*.npy"), key=lambda path: path.stat().st_mtime, reverse=True
+    )
+    for path in files[max_files:]:
+        path.unlink(missing_ok=True)
+
+
 class BathymetryManager:
     """
     Handles ETOPO bathymetry data with lazy loading and bilinear interpolation.
@@ -67,9 +81,16 @@ class BathymetryManager:
         Latitude coordinate array.
     _lons : Optional[np.ndarray]
         Longitude coordinate array.
+    grid_cache : bool
+        Whether depth grids from get_grid_subset are cached on disk.
     """
 
-    def __init__(self, source: str = "gebco2025", data_dir: str = "data/bathymetry"):
+    def __init__(
+        self,
+        source: str = "gebco2025",
+        data_dir: str = "data/bathymetry",
+        grid_cache: bool = False,
+    ):
         """
         Initialize the bathymetry manager.
 
@@ -79,13 +100,19 @@ class BathymetryManager:
             Bathymetry data source (default: "gebco2025").
         data_dir : str, optional
             Data directory. Can be absolute path or relative to current working directory (default: "data/bathymetry").
+        grid_cache : bool, optional
+            Cache depth grids returned by get_grid_subset as .npy files under
+            data_dir/grid_cache for later sessions, keeping the
+            GRID_CACHE_MAX_FILES most recently used (default: False).
         """
         self.source = source
         # Use the provided data_dir exactly as specified - no automatic modifications
         self.data_dir = Path(data_dir).resolve()
+        self.grid_cache = grid_cache
 
         self._is_mock = True
         self._dataset = None
+        self._file_path = None
         self._lats = None
         self._lons = None
         self._depth_var_name = self._get_depth_variable_name()
@@ -166,6 +193,7 @@ class BathymetryManager:
                 self._lons = self._dataset.variables["lon"][:]
                 # Determine depth variable name based on source
                 self._depth_var_name = self._get_depth_variable_name()
+                self._file_path = file_path
                 self._is_mock = False
                 logger.info(f"✅ Loaded bathymetry from {file_path}")
             except Exception as e:
@@ -247,10 +275,9 @@ class BathymetryManager:
 
         Notes
         -----
-        This method performs expensive NetCDF grid slicing operations. Consider using
-        cruiseplan.utils.cache.CacheManager for repeated grid subset requests with
-        overlapping geographic bounds, especially in interactive applications like
-        station_picker and map generation workflows.
+        This method performs expensive NetCDF grid slicing operations. Construct
+        the manager with ``grid_cache=True`` to reuse depth grids across
+        sessions for requests that resolve to the same index window and stride.
         """
         if self._is_mock:
             # Generate synthetic grid
@@ -282,14 +309,63 @@ class BathymetryManager:
         lats = self._lats[lat_idx_min:lat_idx_max:stride]
         lons = self._lons[lon_idx_min:lon_idx_max:stride]
 
-        # Read subset from disk
-        z = self._dataset.variables[self._depth_var_name][
-            lat_idx_min:lat_idx_max:stride, lon_idx_min:lon_idx_max:stride
-        ]
+        window = (lat_idx_min, lat_idx_max, lon_idx_min, lon_idx_max, stride)
+        if self.grid_cache:
+            z = self._get_cached_depths(window)
+        else:
+            z = self._read_depths(window)
 
         xx, yy = np.meshgrid(lons, lats)
         return xx, yy, z
 
+    def _read_depths(self, window: tuple):
+        """Read the strided depth grid for an index window from disk."""
+        lat_idx_min, lat_idx_max, lon_idx_min, lon_idx_max, stride = window
+        return self._dataset.variables[self._depth_var_name][
+            lat_idx_min:lat_idx_max:stride, lon_idx_min:lon_idx_max:stride
+        ]
+
+    def _get_cached_depths(self, window: tuple) -> np.ma.MaskedArray:
+        """
+        Return the depth grid for an index window via the on-disk grid cache.
+
+        Grids are stored as float arrays with NaN for masked cells and loaded
+        memory-mapped. File names include the bathymetry source's modification
+        time, so grids from a replaced source file are never reused; only the
+        GRID_CACHE_MAX_FILES most recently used files are kept.
+        """
+        if self._file_path is None:
+            return self._read_depths(window)
+
+        lat_idx_min, lat_idx_max, lon_idx_min, lon_idx_max, stride = window
+        cache_dir = self.data_dir / GRID_CACHE_DIRNAME
+        try:
+            source_mtime = self._file_path.stat().st_mtime_ns
+        except OSError:
+            return self._read_depths(window)
+        cache_path = cache_dir / (
+            f"{self.source}_{source_mtime}_{lat_idx_min}-{lat_idx_max}"
+            f"_{lon_idx_min}-{lon_idx_max}_s{stride}.npy"
+        )
+
+        try:
+            data = np.load(cache_path, mmap_mode="r")
+            # Mark as recently used so pruning removes other files first
+            os.utime(cache_path)
+            logger.debug(f"Bathymetry grid cache hit: {cache_path.name}")
+        except (OSError, ValueError):
+            data = np.ma.filled(
+                np.ma.asarray(self._read_depths(window), dtype=float), np.nan
+            )
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                np.save(cache_path, data)
+                _prune_grid_cache(cache_dir)
+            except OSError as e:
+                logger.warning(f"Could not write bathymetry grid cache: {e}")
+
+        return np.ma.masked_invalid(data)
+
     def _interpolate_depth(self, lat: float, lon: float) -> float:
         """
         Perform bilinear interpolation on the bathymetry grid.
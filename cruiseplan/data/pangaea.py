@@ -12,6 +12,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 # PangaeaPy Imports
@@ -86,7 +87,7 @@ class PangaeaManager:
             # 2. Extract DOIs correctly
             # The source code provides a helper method for this:
             raw_dois = pq.get_dois()
-            clean_dois = [self._clean_doi(doi) for doi in raw_dois]
+            clean_dois = self._clean_dois(raw_dois)
 
             logger.info(
                 f"Search found {pq.totalcount} total matches. Retrieving first {len(clean_dois)}..."
@@ -283,6 +284,22 @@ class PangaeaManager:
 
         return doi
 
+    def _clean_dois(self, dois: list[str]) -> list[str]:
+        """
+        Clean a batch of DOIs with a single bound cleaner.
+
+        Parameters
+        ----------
+        dois : list[str]
+            DOI strings to clean and validate.
+
+        Returns
+        -------
+        list[str]
+            Cleaned DOI strings, in input order (empty string where invalid).
+        """
+        return list(map(self._clean_doi, dois))
+
     def _fetch_from_api(self, doi: str) -> dict[str, Any] | None:
         """
         Fetch dataset metadata from PANGAEA API.
@@ -511,7 +528,8 @@ def merge_campaign_tracks(datasets: list[dict]) -> list[dict]:
     """
     Merges datasets by their 'label' (campaign).
 
-    Aggregates coordinates into single arrays and collects all source DOIs.
+    Aggregates coordinates into single float64 arrays and collects all
+    source DOIs.
 
     Parameters
     ----------
@@ -540,27 +558,30 @@ def merge_campaign_tracks(datasets: list[dict]) -> list[dict]:
         lons = ds.get("longitude", [])
         doi = ds.get("doi")
 
-        # Robustness: Normalize scalars to lists
-        if not isinstance(lats, list):
-            lats = [lats]
-        if not isinstance(lons, list):
-            lons = [lons]
+        # Robustness: Normalize scalars and lists to 1-D float arrays
+        lats = np.atleast_1d(np.asarray(lats, dtype=np.float64))
+        lons = np.atleast_1d(np.asarray(lons, dtype=np.float64))
 
-        if len(lats) != len(lons):
-            logging.warning(
+        if lats.size != lons.size:
+            logger.warning(
                 f"Skipping segment in {label} (DOI: {doi}): Lat/Lon length mismatch."
             )
             continue
 
-        grouped[label]["latitude"].extend(lats)
-        grouped[label]["longitude"].extend(lons)
+        grouped[label]["latitude"].append(lats)
+        grouped[label]["longitude"].append(lons)
 
         if doi:
             grouped[label]["dois"].add(doi)
 
-    # Convert sets to lists for JSON serialization
+    # Concatenate each campaign's segments once; convert sets to lists
     result = []
     for data in grouped.values():
+        for key in ("latitude", "longitude"):
+            segments = data[key]
+            data[key] = (
+                np.concatenate(segments) if segments else np.empty(0, dtype=np.float64)
+            )
         data["dois"] = list(data["dois"])
         result.append(data)
 
@@ -679,7 +700,7 @@ def load_campaign_data(file_path: str | Path, merge_tracks: bool = True) -> list
 
         if merge_tracks:
             # Apply your crucial merging step here before returning to the GUI
-            logging.info("Merging campaign tracks by label for unique plotting.")
+            logger.info("Merging campaign tracks by label for unique plotting.")
             return merge_campaign_tracks(campaign_data)
         else:
             return campaign_data
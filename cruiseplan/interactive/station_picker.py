@@ -129,6 +129,8 @@ class StationPicker:
         custom_contours: list | None = None,
         overwrite: bool = False,
         max_depth: int | None = None,
+        xlim: tuple[float, float] | None = None,
+        ylim: tuple[float, float] | None = None,
     ):
         """
         Initialize the station picker interface.
@@ -149,6 +151,10 @@ class StationPicker:
             Directory containing bathymetry data files (default: "data/bathymetry")
         overwrite : bool
             Whether to overwrite existing files without prompting (default: False)
+        xlim : tuple of float, optional
+            Initial longitude limits of the map (default: -65 to -5)
+        ylim : tuple of float, optional
+            Initial latitude limits of the map (default: 45 to 70)
         """
         # CRITICAL FIX: Unbind default Matplotlib shortcuts
         self._unbind_default_keys()
@@ -173,7 +179,7 @@ class StationPicker:
 
         # Initialize bathymetry manager with specified source and directory
         self.bathymetry = BathymetryManager(
-            source=bathymetry_source, data_dir=bathymetry_dir
+            source=bathymetry_source, data_dir=bathymetry_dir, grid_cache=True
         )
 
         # Data Storage - initialize with existing stations if provided
@@ -218,9 +224,9 @@ class StationPicker:
         self._setup_widgets()
         self._setup_callbacks()
 
-        # Set initial view to CLI defaults (will be overridden by CLI args)
-        self.ax_map.set_xlim(-65, -5)
-        self.ax_map.set_ylim(45, 70)
+        # Set the initial view before the (only) initial bathymetry render
+        self.ax_map.set_xlim(xlim if xlim is not None else (-65, -5))
+        self.ax_map.set_ylim(ylim if ylim is not None else (45, 70))
 
         self._plot_bathymetry()
         self._plot_initial_campaigns()  # Fixed: Added missing call
@@ -1386,7 +1386,7 @@ def generate_folium_map(
     ----------
     tracks : list of dict
         List of track dictionaries with 'latitude', 'longitude', 'label', 'dois' keys.
-        Each track contains coordinate lists and metadata.
+        Each track contains coordinate lists or arrays and metadata.
     output_file : str or Path, optional
         Path or string for the output HTML file. Default is "cruise_map.html".
     include_eez : bool, optional
@@ -1415,8 +1415,8 @@ def generate_folium_map(
     # 1. Determine Map Center (Average of first track's points)
     first_track = tracks[0]
 
-    # Safety check for empty coordinate lists
-    if not first_track["latitude"] or not first_track["longitude"]:
+    # Safety check for empty coordinates (lists or NumPy arrays)
+    if len(first_track["latitude"]) == 0 or len(first_track["longitude"]) == 0:
         logger.error(f"Track {first_track.get('label')} has no coordinates.")
         return None
 
@@ -1441,7 +1441,7 @@ def generate_folium_map(
         label = track.get("label", "Unknown")
         dois = track.get("dois", [])
 
-        if not lats or not lons:
+        if len(lats) == 0 or len(lons) == 0:
             continue
 
         # Zip coordinates for Folium (Lat, Lon)
@@ -1578,7 +1578,7 @@ def _add_eez_boundaries(folium_map, tracks: list[dict[str, Any]]) -> None:
     all_lons = []
 
     for track in tracks:
-        if track.get("latitude") and track.get("longitude"):
+        if len(track.get("latitude", [])) and len(track.get("longitude", [])):
             all_lats.extend(track["latitude"])
             all_lons.extend(track["longitude"])
 
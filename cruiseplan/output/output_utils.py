@@ -9,6 +9,32 @@ code duplication.
 from datetime import datetime
 from typing import Any
 
+# Operation types displayed in upper case rather than title case
+_ACRONYM_OP_TYPES = ("CTD", "ADCP", "GPS", "USBL")
+
+
+def _display_op_type(op_type: str) -> str:
+    """Display form of an op_type: upper case for acronyms, else title case."""
+    if op_type.upper() in _ACRONYM_OP_TYPES:
+        return op_type.upper()
+    return op_type.title()
+
+
+# Precomputed display forms of the op_types the scheduler emits
+_OP_TYPE_DISPLAY = {
+    op_type: _display_op_type(op_type)
+    for op_type in (
+        "CTD",
+        "mooring",
+        "port",
+        "transit",
+        "buffer",
+        "underway",
+        "towing",
+        "survey",
+    )
+}
+
 
 def get_activity_depth(activity: dict[str, Any]) -> float:
     """
@@ -82,10 +108,9 @@ def format_activity_type(activity: dict[str, Any]) -> str:
     action = activity.get("action")
 
     # Preserve case for known acronyms
-    if op_type.upper() in ["CTD", "ADCP", "CTD", "GPS", "USBL"]:
-        formatted_op_type = op_type.upper()
-    else:
-        formatted_op_type = op_type.title()
+    formatted_op_type = _OP_TYPE_DISPLAY.get(op_type)
+    if formatted_op_type is None:
+        formatted_op_type = _display_op_type(op_type)
 
     if action:
         # Format as "op_type action" (e.g. "CTD profile", "Port mob")
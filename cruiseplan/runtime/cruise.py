@@ -90,7 +90,7 @@ class CruiseInstance:
         self.raw_data = self._load_yaml()
 
         # 1. Validation Pass (Pydantic)
-        self.config = CruiseConfig(**self.raw_data)
+        self.config = CruiseConfig.model_validate(self.raw_data)
 
         # 2. Indexing Pass (Build the Catalog Registry)
         self.point_registry: dict[str, PointDefinition] = {
@@ -584,8 +584,8 @@ class CruiseInstance:
         instance.config_path = None
         instance.raw_data = config_dict.copy()
 
-        # 1. Validation Pass (Pydantic)
-        instance.config = CruiseConfig(**instance.raw_data)
+        # 1. Validation Pass (Pydantic; reuses the class-level compiled validator)
+        instance.config = CruiseConfig.model_validate(instance.raw_data)
 
         # 2. Indexing Pass (Build the Catalog Registry)
         instance.point_registry: dict[str, PointDefinition] = {
@@ -707,7 +707,7 @@ class CruiseInstance:
         self,
         bathymetry_source: str = "gebco2025",
         bathymetry_dir: str = "data/bathymetry",
-    ) -> set[str]:
+    ) -> int:
         """
         Add bathymetry depths to stations that are missing water_depth values.
 
@@ -724,8 +724,8 @@ class CruiseInstance:
 
         Returns
         -------
-        set[str]
-            Set of station names that had depths added.
+        int
+            Number of stations that had depths added.
         """
         return enrichment.enrich_depths(self, bathymetry_source, bathymetry_dir)
 
@@ -7,12 +7,14 @@ individual stations. These functions operate on CruiseInstance objects.
 """
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from cruiseplan.config.activities import PointDefinition
 from cruiseplan.config.values import DEFAULT_STATION_SPACING_KM
 from cruiseplan.data.bathymetry import BathymetryManager
-from cruiseplan.timeline.distance import haversine_distance
+from cruiseplan.timeline.distance import route_segment_distances
+from cruiseplan.utils.coordinates import CoordConverter, format_ddm_comment
 from cruiseplan.utils.plot_config import interpolate_great_circle_position
 
 if TYPE_CHECKING:
@@ -20,6 +22,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Position-string formatters by coord_format; formats without an entry only
+# get the decimal-minutes fields.
+_POSITION_FORMATTERS: dict[str, Callable[[float, float], str]] = {
+    "ddm": format_ddm_comment,
+}
+
 
 def _sanitize_name_for_stations(name: str) -> str:
     """
@@ -267,10 +275,7 @@ def expand_sections(
             continue
 
         # Compute per-segment distances
-        segment_distances = [
-            haversine_distance(waypoints[i], waypoints[i + 1])
-            for i in range(len(waypoints) - 1)
-        ]
+        segment_distances = route_segment_distances(waypoints)
 
         # Build the list of station positions segment by segment, so every
         # route waypoint is always a station.  Each segment contributes
@@ -382,7 +387,7 @@ def enrich_depths(
     bathymetry_source: str = "gebco2025",
     bathymetry_dir: str = "data/bathymetry",
     overwrite_existing: bool = False,
-) -> set[str]:
+) -> int:
     """
     Add missing depth values to stations using bathymetry data.
 
@@ -403,10 +408,10 @@ def enrich_depths(
 
     Returns
     -------
-    set[str]
-        Set of station names that had depths added or updated
+    int
+        Number of stations that had depths added or updated
     """
-    stations_with_depths_added = set()
+    stations_with_depths_added = 0
 
     # Initialize bathymetry manager
     bathymetry = BathymetryManager(source=bathymetry_source, data_dir=bathymetry_dir)
@@ -434,7 +439,7 @@ def enrich_depths(
                 # Add depth and bathymetry source to station
                 station.__dict__["water_depth"] = water_depth
                 station.__dict__["bathymetry_source"] = bathymetry_source
-                stations_with_depths_added.add(station_name)
+                stations_with_depths_added += 1
 
                 logger.debug(
                     f"Added depth to {station_name}: {water_depth:.1f}m from {bathymetry_source}"
@@ -446,7 +451,7 @@ def enrich_depths(
 
     if stations_with_depths_added:
         logger.info(
-            f"Added depths to {len(stations_with_depths_added)} stations using {bathymetry_source}"
+            f"Added depths to {stations_with_depths_added} stations using {bathymetry_source}"
         )
 
     return stations_with_depths_added
@@ -513,6 +518,7 @@ def add_coordinate_displays(
         Number of entities that had coordinate displays added
     """
     coord_changes_made = 0
+    format_position = _POSITION_FORMATTERS.get(coord_format)
 
     # Add coordinate displays for points that have coordinates but lack display fields
     for point in cruise_instance.point_registry.values():
@@ -524,17 +530,12 @@ def add_coordinate_displays(
         ):
             # For now, we'll add the coordinate display as a "position_string" field
             # This will be used for display purposes in the output
-            if coord_format == "ddm":
-                from cruiseplan.utils.coordinates import format_ddm_comment
-
-                position_display = format_ddm_comment(point.latitude, point.longitude)
+            if format_position is not None:
                 # Set the position string for display (this gets used in YAML output)
-                point.position_string = position_display
+                point.position_string = format_position(point.latitude, point.longitude)
                 coord_changes_made += 1
 
             # Always add individual decimal minutes fields for oceanographic use
-            from cruiseplan.utils.coordinates import CoordConverter
-
             point.__dict__["latitude_decmin"] = CoordConverter.format_latitude_decmin(
                 point.latitude
             )
@@ -554,8 +555,6 @@ def add_coordinate_displays(
                     and route_point.longitude is not None
                 ):
                     # Add individual decimal minutes fields for route points
-                    from cruiseplan.utils.coordinates import CoordConverter
-
                     route_point.__dict__["latitude_decmin"] = (
                         CoordConverter.format_latitude_decmin(route_point.latitude)
                     )
@@ -575,8 +574,6 @@ def add_coordinate_displays(
                     and vertex.longitude is not None
                 ):
                     # Add individual decimal minutes fields for area vertices
-                    from cruiseplan.utils.coordinates import CoordConverter
-
                     vertex.__dict__["latitude_decmin"] = (
                         CoordConverter.format_latitude_decmin(vertex.latitude)
                     )
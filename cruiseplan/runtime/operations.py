@@ -15,6 +15,7 @@ for stations, moorings, areas, and transects.
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any
 
 from cruiseplan.config.activities import (
@@ -25,6 +26,7 @@ from cruiseplan.config.activities import (
 )
 from cruiseplan.config.fields import ACTION_FIELD
 from cruiseplan.config.values import ActionEnum
+from cruiseplan.utils.units import MINUTES_PER_HOUR, NM_PER_KM
 
 # Port actions that identify mobilization/demobilization operations
 PORT_ACTIONS = [ActionEnum.MOB.value, ActionEnum.DEMOB.value]
@@ -46,6 +48,13 @@ class BaseOperation(ABC):
         Optional human-readable comment or description.
     """
 
+    # Optional fields read for every scheduled activity. Subclasses that
+    # support them set them in __init__; the rest inherit these defaults.
+    operation_depth: float | None = None
+    water_depth: float | None = None
+    delay_start: float = 0.0
+    action: Any = None
+
     def __init__(
         self,
         name: str,
@@ -145,6 +154,18 @@ class BaseOperation(ABC):
         class_name = self.__class__.__name__
         return class_name.replace("Operation", "")
 
+    def get_operation_distance_nm(self) -> float:
+        """
+        Get the distance covered by the operation itself.
+
+        Returns
+        -------
+        float
+            Distance in nautical miles; 0.0 for operations that do not move
+            the vessel.
+        """
+        return 0.0
+
     def get_label(self) -> str:
         """
         Get human-readable label for this operation.
@@ -488,6 +509,20 @@ class LineOperation(BaseOperation):
         self.op_type = op_type
         self.action = action
 
+    @cached_property
+    def route_distance_km(self) -> float:
+        """
+        Total route distance in kilometers, computed once per operation.
+
+        Returns
+        -------
+        float
+            Sum of the Haversine distances between consecutive waypoints.
+        """
+        from cruiseplan.timeline.distance import route_distance
+
+        return route_distance(self.route)
+
     def calculate_duration(self, rules: Any) -> float:
         """
         Calculate duration for the line operation based on route distance and vessel speed.
@@ -506,11 +541,9 @@ class LineOperation(BaseOperation):
             return 0.0
 
         # Use centralized calculators
-        from cruiseplan.timeline.distance import route_distance
         from cruiseplan.timeline.duration import DurationCalculator
 
-        # Calculate route distance using centralized function
-        route_distance_km = route_distance(self.route)
+        route_distance_km = self.route_distance_km
 
         # Use DurationCalculator if rules/config available
         if hasattr(rules, "config"):
@@ -524,12 +557,8 @@ class LineOperation(BaseOperation):
             return calc.calculate_transit_time(route_distance_km, effective_speed)
         else:
             # Fallback for cases without config
-            from cruiseplan.utils.units import hours_to_minutes, km_to_nm
-
             vessel_speed = self.speed or 10.0
-            route_distance_nm = km_to_nm(route_distance_km)
-            duration_hours = route_distance_nm / vessel_speed
-            return hours_to_minutes(duration_hours)
+            return route_distance_km * NM_PER_KM / vessel_speed * MINUTES_PER_HOUR
 
     def get_entry_point(self) -> tuple[float, float]:
         """
@@ -573,13 +602,7 @@ class LineOperation(BaseOperation):
         if not self.route or len(self.route) < 2:
             return 0.0
 
-        # Use centralized calculators
-        from cruiseplan.timeline.distance import route_distance
-        from cruiseplan.utils.units import km_to_nm
-
-        # Calculate route distance and convert to nautical miles
-        route_distance_km = route_distance(self.route)
-        return km_to_nm(route_distance_km)
+        return self.route_distance_km * NM_PER_KM
 
     @classmethod
     def from_pydantic(
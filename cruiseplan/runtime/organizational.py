@@ -159,8 +159,9 @@ class Cluster(BaseOrganizationUnit):
         ValueError
             If operation with the same name already exists in cluster.
         """
-        # Check for name conflicts within the cluster
-        if any(op.name == operation.name for op in self.operations):
+        # Check for name conflicts within the cluster (plain early-exit loop
+        # in get_operation rather than an any() generator per call)
+        if self.get_operation(operation.name) is not None:
             raise ValueError(
                 f"Operation '{operation.name}' already exists in cluster '{self.name}'"
             )
@@ -12,6 +12,11 @@ These modules provide the mathematical and algorithmic foundation for determinin
 distances, durations, optimal routes, and scheduling sequences in oceanographic cruises.
 """
 
-from .scheduler import CruiseSchedule, generate_timeline
+from .scheduler import (
+    CruiseSchedule,
+    generate_timeline,
+    iter_timeline,
+    timeline_columns,
+)
 
-__all__ = ["CruiseSchedule", "generate_timeline"]
+__all__ = ["CruiseSchedule", "generate_timeline", "iter_timeline", "timeline_columns"]
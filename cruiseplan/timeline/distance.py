@@ -7,13 +7,20 @@ Includes utilities for route distance calculation and unit conversions between
 kilometers and nautical miles.
 """
 
-import math
+from math import asin, cos, radians, sin, sqrt
+
+import numpy as np
 
 from cruiseplan.config.activities import GeoPoint
 
 # Earth radius in kilometers (WGS84 approximate) - used for haversine distance calculation
 R_EARTH_KM = 6371.0
 
+# Routes with at least this many points (or pair lists with this many pairs)
+# are measured with NumPy; below that the array setup costs more than the
+# scalar loop.
+_VECTORIZE_MIN_POINTS = 32
+
 
 def to_coords(point: GeoPoint | tuple[float, float]) -> tuple[float, float]:
     """
@@ -22,18 +29,22 @@ def to_coords(point: GeoPoint | tuple[float, float]) -> tuple[float, float]:
     Parameters
     ----------
     point : GeoPoint or tuple of float
-        Input point as either a GeoPoint object or (lat, lon) tuple.
+        Input point as either a GeoPoint object or (lat, lon) tuple. Any
+        object with ``latitude``/``longitude`` attributes or keys is accepted.
 
     Returns
     -------
     tuple of float
         (latitude, longitude) coordinates in decimal degrees.
     """
-    if isinstance(point, GeoPoint):
+    try:
         return (point.latitude, point.longitude)
-    if isinstance(point, dict) and "latitude" in point and "longitude" in point:
+    except AttributeError:
+        pass
+    try:
         return (point["latitude"], point["longitude"])
-    return point
+    except (TypeError, KeyError, IndexError):
+        return point
 
 
 def haversine_distance(
@@ -58,19 +69,150 @@ def haversine_distance(
     lat1, lon1 = to_coords(start)
     lat2, lon2 = to_coords(end)
 
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
+    # Module-level math names and products instead of ** keep the
+    # interpreter work per call small
+    phi1, phi2 = radians(lat1), radians(lat2)
+    sin_half_dphi = sin((phi2 - phi1) * 0.5)
+    sin_half_dlambda = sin(radians(lon2 - lon1) * 0.5)
 
     a = (
-        math.sin(dphi / 2) ** 2
-        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+        sin_half_dphi * sin_half_dphi
+        + cos(phi1) * cos(phi2) * sin_half_dlambda * sin_half_dlambda
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # a is in [0, 1]; clamp guards against rounding just above 1
+    c = 2 * asin(sqrt(min(a, 1.0)))
 
     return R_EARTH_KM * c
 
 
+def haversine_distance_vector(
+    lats1: np.ndarray,
+    lons1: np.ndarray,
+    lats2: np.ndarray,
+    lons2: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate Great Circle distances between paired arrays of points.
+
+    Vectorized counterpart of :func:`haversine_distance`; inputs broadcast
+    against each other.
+
+    Parameters
+    ----------
+    lats1, lons1 : np.ndarray
+        Start latitudes and longitudes in decimal degrees.
+    lats2, lons2 : np.ndarray
+        End latitudes and longitudes in decimal degrees.
+
+    Returns
+    -------
+    np.ndarray
+        Distances in kilometers, one per pair.
+    """
+    # Broadcast up front so every intermediate has the full output shape
+    shape = np.broadcast(lats1, lons1, lats2, lons2).shape
+    lats1, lons1, lats2, lons2 = np.broadcast_arrays(
+        *np.atleast_1d(lats1, lons1, lats2, lons2)
+    )
+
+    # Same operation order as the scalar version, but each step writes into
+    # an array allocated earlier instead of a fresh temporary
+    phi1 = np.radians(lats1)
+    phi2 = np.radians(lats2)
+
+    sin_sq_half_dphi = np.subtract(phi2, phi1)
+    sin_sq_half_dphi *= 0.5
+    np.sin(sin_sq_half_dphi, out=sin_sq_half_dphi)
+    sin_sq_half_dphi *= sin_sq_half_dphi
+
+    sin_half_dlambda = np.radians(np.subtract(lons2, lons1))
+    sin_half_dlambda *= 0.5
+    np.sin(sin_half_dlambda, out=sin_half_dlambda)
+
+    a = np.cos(phi1, out=phi1)
+    a *= np.cos(phi2, out=phi2)
+    a *= sin_half_dlambda
+    a *= sin_half_dlambda
+    a += sin_sq_half_dphi
+
+    np.minimum(a, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * R_EARTH_KM
+    return a.reshape(shape)
+
+
+def paired_distances(
+    starts: list[GeoPoint | tuple[float, float]],
+    ends: list[GeoPoint | tuple[float, float]],
+) -> list[float]:
+    """
+    Calculate Great Circle distances between corresponding points of two lists.
+
+    Parameters
+    ----------
+    starts : list of GeoPoint or tuple of float
+        Start point of each pair.
+    ends : list of GeoPoint or tuple of float
+        End point of each pair, same length as ``starts``.
+
+    Returns
+    -------
+    list of float
+        Distances in kilometers, one per pair.
+    """
+    if len(starts) < _VECTORIZE_MIN_POINTS:
+        return [
+            haversine_distance(start, end)
+            for start, end in zip(starts, ends, strict=True)
+        ]
+
+    start_coords = np.array([to_coords(point) for point in starts], dtype=np.float64)
+    end_coords = np.array([to_coords(point) for point in ends], dtype=np.float64)
+    return haversine_distance_vector(
+        start_coords[:, 0], start_coords[:, 1], end_coords[:, 0], end_coords[:, 1]
+    ).tolist()
+
+
+def route_segment_distances(
+    points: list[GeoPoint | tuple[float, float]],
+) -> list[float]:
+    """
+    Calculate the distance of each segment of a path connecting multiple points.
+
+    Parameters
+    ----------
+    points : list of GeoPoint or tuple of float
+        Ordered list of points defining the route.
+
+    Returns
+    -------
+    list of float
+        Segment distances in kilometers; ``len(points) - 1`` entries.
+    """
+    coords = [to_coords(point) for point in points]
+
+    if len(coords) >= _VECTORIZE_MIN_POINTS:
+        return _route_segment_distances_np(np.array(coords, dtype=np.float64)).tolist()
+
+    # Each interior point ends one segment and starts the next: convert its
+    # latitude and take the cosine once instead of once per segment. The
+    # per-segment arithmetic is otherwise that of haversine_distance.
+    phis = [radians(lat) for lat, _ in coords]
+    cos_phis = [cos(phi) for phi in phis]
+
+    distances = []
+    for i in range(len(coords) - 1):
+        sin_half_dphi = sin((phis[i + 1] - phis[i]) * 0.5)
+        sin_half_dlambda = sin(radians(coords[i + 1][1] - coords[i][1]) * 0.5)
+        a = (
+            sin_half_dphi * sin_half_dphi
+            + cos_phis[i] * cos_phis[i + 1] * sin_half_dlambda * sin_half_dlambda
+        )
+        distances.append(R_EARTH_KM * (2 * asin(sqrt(min(a, 1.0)))))
+    return distances
+
+
 def route_distance(points: list[GeoPoint | tuple[float, float]]) -> float:
     """
     Calculate total distance of a path connecting multiple points.
@@ -88,7 +230,44 @@ def route_distance(points: list[GeoPoint | tuple[float, float]]) -> float:
     if not points or len(points) < 2:
         return 0.0
 
-    total = 0.0
-    for i in range(len(points) - 1):
-        total += haversine_distance(points[i], points[i + 1])
-    return total
+    return sum(route_segment_distances(points))
+
+
+def _route_segment_distances_np(coords: np.ndarray) -> np.ndarray:
+    """
+    Calculate Haversine segment distances along a route in one vectorized pass.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        Array of shape (N, 2) with (latitude, longitude) in decimal degrees.
+
+    Returns
+    -------
+    np.ndarray
+        Segment distances in kilometers; ``N - 1`` entries.
+    """
+    lat = np.radians(coords[:, 0])
+    # cos(lat) once per point, shared by the two segments meeting there
+    cos_lat = np.cos(lat)
+
+    # Build the haversine term in place to keep to two segment-sized buffers;
+    # as in haversine_distance, the longitude difference is taken in degrees
+    a = np.diff(lat)
+    a *= 0.5
+    np.sin(a, out=a)
+    a *= a
+    h = np.diff(coords[:, 1])
+    np.radians(h, out=h)
+    h *= 0.5
+    np.sin(h, out=h)
+    h *= h
+    h *= cos_lat[:-1]
+    h *= cos_lat[1:]
+    a += h
+
+    np.minimum(a, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * R_EARTH_KM
+    return a
@@ -6,14 +6,17 @@ including CTD profiling, vessel transit, and operational constraints based on
 day/night windows. Uses configuration parameters for vessel speeds and CTD rates.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Literal
 
+import numpy as np
+
 from cruiseplan.config.cruise_config import CruiseConfig
 from cruiseplan.utils.units import (
-    hours_to_minutes,
-    km_to_nm,
-    rate_per_second_to_rate_per_minute,
+    MINUTES_PER_HOUR,
+    NM_PER_KM,
+    SECONDS_PER_DAY,
+    SECONDS_PER_MINUTE,
 )
 
 
@@ -62,18 +65,18 @@ class DurationCalculator:
         if depth <= 0:
             return 0.0
 
-        descent_m_sec = self.config.ctd_descent_rate
-        ascent_m_sec = self.config.ctd_ascent_rate
-        # Convert rates (m/s) to m/min
-        descent_m_min = rate_per_second_to_rate_per_minute(descent_m_sec)
-        ascent_m_min = rate_per_second_to_rate_per_minute(ascent_m_sec)
-
+        config = self.config
+        descent_m_sec = config.ctd_descent_rate
+        ascent_m_sec = config.ctd_ascent_rate
         # Avoid division by zero
-        if descent_m_min <= 0 or ascent_m_min <= 0:
+        if descent_m_sec <= 0 or ascent_m_sec <= 0:
             return 0.0
 
-        profile_time = (depth / descent_m_min) + (depth / ascent_m_min)
-        return profile_time + self.config.turnaround_time
+        # Rates are m/s; scale to m/min inline rather than via the units helper
+        profile_time = depth / (descent_m_sec * SECONDS_PER_MINUTE) + depth / (
+            ascent_m_sec * SECONDS_PER_MINUTE
+        )
+        return profile_time + config.turnaround_time
 
     def calculate_transit_time(
         self, distance_km: float, speed_knots: float | None = None
@@ -99,9 +102,65 @@ class DurationCalculator:
         if speed <= 0:
             return 0.0
 
-        distance_nm = km_to_nm(distance_km)
-        duration_hours = distance_nm / speed
-        return hours_to_minutes(duration_hours)
+        # Same arithmetic as hours_to_minutes(km_to_nm(d) / speed), inlined
+        return distance_km * NM_PER_KM / speed * MINUTES_PER_HOUR
+
+    def calculate_ctd_time_batch(self, depths: np.ndarray) -> np.ndarray:
+        """
+        Calculate CTD profiling durations for an array of depths.
+
+        Vectorized counterpart of :meth:`calculate_ctd_time`.
+
+        Parameters
+        ----------
+        depths : np.ndarray
+            Water depths in meters.
+
+        Returns
+        -------
+        np.ndarray
+            Total durations in minutes; zero where depth <= 0.
+        """
+        depths = np.asarray(depths, dtype=float)
+        config = self.config
+        descent_m_sec = config.ctd_descent_rate
+        ascent_m_sec = config.ctd_ascent_rate
+        if descent_m_sec <= 0 or ascent_m_sec <= 0:
+            return np.zeros_like(depths)
+
+        profile_time = depths / (descent_m_sec * SECONDS_PER_MINUTE) + depths / (
+            ascent_m_sec * SECONDS_PER_MINUTE
+        )
+        return np.where(depths > 0, profile_time + config.turnaround_time, 0.0)
+
+    def calculate_transit_time_batch(
+        self, distances_km: np.ndarray, speed_knots: float | None = None
+    ) -> np.ndarray:
+        """
+        Calculate vessel transit durations for an array of distances.
+
+        Vectorized counterpart of :meth:`calculate_transit_time`.
+
+        Parameters
+        ----------
+        distances_km : np.ndarray
+            Distances to travel in kilometers.
+        speed_knots : float, optional
+            Vessel speed in knots. If None, uses config default.
+
+        Returns
+        -------
+        np.ndarray
+            Transit durations in minutes.
+        """
+        distances_km = np.asarray(distances_km, dtype=float)
+        speed = (
+            speed_knots if speed_knots is not None else self.config.default_vessel_speed
+        )
+        if speed <= 0:
+            return np.zeros_like(distances_km)
+
+        return distances_km * NM_PER_KM / speed * MINUTES_PER_HOUR
 
     def calculate_wait_time(
         self,
@@ -129,36 +188,34 @@ class DurationCalculator:
         if not required_window:
             return 0.0
 
-        current_dt = arrival_dt
-
-        # Define window boundaries relative to current_dt
-        day_start = current_dt.replace(
-            hour=self.day_start_hour, minute=0, second=0, microsecond=0
-        )
-        day_end = current_dt.replace(
-            hour=self.day_end_hour, minute=0, second=0, microsecond=0
+        # Work in wall-clock seconds since midnight instead of building
+        # replace()d datetimes and timedeltas
+        sod = (
+            arrival_dt.hour * 3600
+            + arrival_dt.minute * 60
+            + arrival_dt.second
+            + arrival_dt.microsecond / 1e6
         )
+        day_start_s = self.day_start_hour * 3600
+        day_end_s = self.day_end_hour * 3600
 
-        is_daytime_arrival = self.day_start_hour <= current_dt.hour < self.day_end_hour
+        is_daytime_arrival = day_start_s <= sod < day_end_s
 
         if required_window == "day":
             # A: Too Early (Night before)
-            if current_dt.hour < self.day_start_hour:
-                return (day_start - current_dt).total_seconds() / 60.0
+            if sod < day_start_s:
+                return (day_start_s - sod) / 60.0
 
             # B: Too Late (Night after)
-            if current_dt.hour >= self.day_end_hour:
-                next_start = day_start + timedelta(days=1)
-                return (next_start - current_dt).total_seconds() / 60.0
+            if sod >= day_end_s:
+                return (SECONDS_PER_DAY - sod + day_start_s) / 60.0
 
             # C: Day Arrival -> Check if finish fits
             if is_daytime_arrival:
-                finish_time = current_dt + timedelta(minutes=duration_minutes)
-                if finish_time <= day_end:
+                if sod + duration_minutes * 60.0 <= day_end_s:
                     return 0.0
                 else:
-                    next_start = day_start + timedelta(days=1)
-                    return (next_start - current_dt).total_seconds() / 60.0
+                    return (SECONDS_PER_DAY - sod + day_start_s) / 60.0
 
         elif required_window == "night":
             # Simplified: If at night, start. If at day, wait for night.
@@ -166,6 +223,6 @@ class DurationCalculator:
                 return 0.0
 
             # Wait for sunset
-            return (day_end - current_dt).total_seconds() / 60.0
+            return (day_end_s - sod) / 60.0
 
         return 0.0
@@ -10,10 +10,13 @@ with a focus on:
 """
 
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 from cruiseplan.config.activities import GeoPoint
 from cruiseplan.config.cruise_config import CruiseConfig
 from cruiseplan.runtime.operations import (
@@ -22,8 +25,8 @@ from cruiseplan.runtime.operations import (
     LineOperation,
     PointOperation,
 )
-from cruiseplan.timeline.distance import haversine_distance
-from cruiseplan.utils.units import km_to_nm
+from cruiseplan.timeline.distance import haversine_distance, paired_distances
+from cruiseplan.utils.units import MINUTES_PER_HOUR, NM_PER_KM
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +54,7 @@ class OperationCoordinates:
             self.exit = GeoPoint(latitude=self.exit[0], longitude=self.exit[1])
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityRecord:
     """Standardized activity record for timeline output."""
 
@@ -80,14 +83,10 @@ class ActivityRecord:
 
     def __init__(self, data: dict[str, Any]):
         """Initialize from dictionary for compatibility with old system."""
-        # Initialize all fields to None first
+        # Unknown keys are ignored; missing fields default to None
+        get = data.get
         for field in self.__dataclass_fields__:
-            setattr(self, field, None)
-
-        # Then set values from data
-        for key, value in data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+            setattr(self, field, get(field))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for output compatibility.
@@ -124,6 +123,7 @@ class NavigationalTransit(BaseOperation):
         config: CruiseConfig,
         leg_name: str,
         vessel_speed: float | None = None,
+        distance_km: float | None = None,
     ):
         name = f"Transit to {to_op.get_label()}"
         super().__init__(name)
@@ -134,22 +134,31 @@ class NavigationalTransit(BaseOperation):
         self.vessel_speed = vessel_speed or getattr(
             config, "default_vessel_speed", 10.0
         )
+        # Endpoints are resolved once and shared by the distance and the record
+        self.entry_point = from_op.get_exit_point()
+        self.exit_point = to_op.get_entry_point()
+        # Straight-line distance, computed once unless the caller batched it
+        if distance_km is None:
+            distance_km = (
+                0.0
+                if self.entry_point == self.exit_point
+                else haversine_distance(self.entry_point, self.exit_point)
+            )
+        self.distance_km = distance_km
+        # Converted once for both the duration and the reported distance
+        self.distance_nm = distance_km * NM_PER_KM
 
     def calculate_duration(self, rules: Any) -> float:
         """Calculate based on transit distance and vessel speed."""
-        exit_pt = self.from_op.get_exit_point()
-        entry_pt = self.to_op.get_entry_point()
-        distance_km = haversine_distance(exit_pt, entry_pt)
-        distance_nm = km_to_nm(distance_km)
-        return (distance_nm / self.vessel_speed) * 60.0  # hours to minutes
+        return self.distance_nm / self.vessel_speed * MINUTES_PER_HOUR
 
     def get_entry_point(self) -> tuple[float, float]:
         """Transit starts where previous operation ended."""
-        return self.from_op.get_exit_point()
+        return self.entry_point
 
     def get_exit_point(self) -> tuple[float, float]:
         """Transit ends where next operation begins."""
-        return self.to_op.get_entry_point()
+        return self.exit_point
 
     def get_operation_type(self) -> str:
         """Override default to return specific transit type."""
@@ -157,10 +166,7 @@ class NavigationalTransit(BaseOperation):
 
     def get_operation_distance_nm(self) -> float:
         """Calculate straight-line distance between operations."""
-        exit_pt = self.from_op.get_exit_point()
-        entry_pt = self.to_op.get_entry_point()
-        distance_km = haversine_distance(exit_pt, entry_pt)
-        return km_to_nm(distance_km)
+        return self.distance_nm
 
     def get_vessel_speed(self) -> float:
         """Get vessel speed (leg-specific or default)."""
@@ -175,39 +181,50 @@ class NavigationalTransit(BaseOperation):
 class OperationFactory:
     """Factory for creating operation objects from configuration data."""
 
+    # Catalogs searched for an activity name, in precedence order
+    CATALOGS = ("points", "ports", "lines", "areas")
+
     def __init__(self, config: CruiseConfig):
         self.config = config
+        self._catalog_index: dict[str, tuple[str, Any]] | None = None
+        # Operations depend only on the name, so repeated references share one
+        self._operations: dict[str, BaseOperation] = {}
+
+    def _build_catalog_index(self) -> dict[str, tuple[str, Any]]:
+        """Map each activity name to (catalog name, definition); first match wins."""
+        index: dict[str, tuple[str, Any]] = {}
+        for catalog_name in self.CATALOGS:
+            for item in getattr(self.config, catalog_name, None) or []:
+                index.setdefault(item.name, (catalog_name, item))
+        return index
 
     def create_operation(self, name: str, leg_name: str) -> BaseOperation:
         """Create operation from configuration using catalog-based type detection."""
-        # Check each catalog to find the operation
-        catalog_checks = [
-            ("points", "point"),
-            ("ports", "point"),
-            ("lines", "line"),
-            ("areas", "area"),
-        ]
-
-        for catalog_name, operation_type in catalog_checks:
-            catalog = getattr(self.config, catalog_name, None)
-            if not catalog:
-                continue
-
-            for item in catalog:
-                if item.name == name:
-                    # Use appropriate factory based on operation type
-                    if operation_type == "point":
-                        # Special handling for ports which use PortDefinition instead of StationDefinition
-                        if catalog_name == "ports":
-                            return PointOperation.from_port(item)
-                        else:
-                            return PointOperation.from_pydantic(item)
-                    elif operation_type == "line":
-                        return LineOperation.from_pydantic(
-                            item, self.config.default_vessel_speed
-                        )
-                    elif operation_type == "area":
-                        return AreaOperation.from_pydantic(item)
+        operation = self._operations.get(name)
+        if operation is None:
+            operation = self._operations[name] = self._resolve_operation(name)
+        return operation
+
+    def _resolve_operation(self, name: str) -> BaseOperation:
+        """Build the operation for a name from the catalogs or the port registry."""
+        # Name -> definition index over all catalogs, built on first lookup
+        if self._catalog_index is None:
+            self._catalog_index = self._build_catalog_index()
+
+        match = self._catalog_index.get(name)
+        if match is not None:
+            catalog_name, item = match
+            # Ports use PortDefinition instead of StationDefinition
+            if catalog_name == "ports":
+                return PointOperation.from_port(item)
+            elif catalog_name == "points":
+                return PointOperation.from_pydantic(item)
+            elif catalog_name == "lines":
+                return LineOperation.from_pydantic(
+                    item, self.config.default_vessel_speed
+                )
+            else:
+                return AreaOperation.from_pydantic(item)
 
         # Fallback: Try to resolve from global ports registry
         try:
@@ -606,27 +623,58 @@ def calculate_timeline_statistics(
 # =============================================================================
 
 
+def _enum_value(value: Any) -> Any:
+    """String value of an enum member or other truthy value; falsy values as-is."""
+    if not value:
+        return value
+    return str(getattr(value, "value", value))
+
+
+class _DurationRules:
+    """Minimal rules object exposing ``config`` to ``calculate_duration``."""
+
+    __slots__ = ("config",)
+
+    def __init__(self, config: CruiseConfig):
+        self.config = config
+
+
 class TimelineGenerator:
     """Generates cruise timeline from operations and legs."""
 
     def __init__(self, config: CruiseConfig):
         self.config = config
         self.factory = OperationFactory(config)
+        # Config leg definitions by name, built on first lookup
+        self._config_legs: dict[str, Any] | None = None
         self.current_time = self._parse_start_datetime()
 
+    @property
+    def current_time(self) -> datetime | None:
+        """Current schedule time (anchor datetime plus elapsed minutes)."""
+        if self._start_time is None:
+            return None
+        return self._start_time + timedelta(minutes=self._elapsed_minutes)
+
+    @current_time.setter
+    def current_time(self, value: datetime | None) -> None:
+        # Re-anchor; the scheduler then only accumulates float minutes
+        self._start_time = value
+        self._elapsed_minutes = 0.0
+
     def generate_timeline(self, legs: list[Any] | None = None) -> CruiseSchedule:
         """Generate complete cruise timeline."""
+        return list(self.iter_timeline(legs))
+
+    def iter_timeline(self, legs: list[Any] | None = None) -> Iterator[dict[str, Any]]:
+        """Yield timeline activities one leg at a time, without building the list."""
         if legs is None:
             legs = self._create_runtime_legs()
 
-        timeline = []
-
         for leg in legs:
-            leg_activities = self._process_leg(leg)
-            timeline.extend(leg_activities)
-
-        # Convert ActivityRecord objects to dictionaries for output compatibility
-        return [activity.to_dict() for activity in timeline]
+            # Convert ActivityRecord objects to dictionaries for output compatibility
+            for activity in self._process_leg(leg):
+                yield activity.to_dict()
 
     def _create_runtime_legs(self) -> list[Any]:
         """Create runtime legs from config."""
@@ -662,14 +710,15 @@ class TimelineGenerator:
     def _process_leg(self, leg: Any) -> list[ActivityRecord]:
         """Process a single leg and generate activities."""
         # Initialize current_time if not set
-        if self.current_time is None:
+        if self._start_time is None:
             self.current_time = self._parse_start_datetime()
 
         # Apply leg-level delay (e.g. port clearance wait before departure)
         leg_delay = getattr(leg, "delay_start", None) or 0.0
         if leg_delay:
-            self.current_time = self.current_time + timedelta(minutes=leg_delay)
+            self._elapsed_minutes += leg_delay
 
+        # Activity fields without times; start/end are assigned in one pass at the end
         activities = []
 
         # Build scientific sequence: departure_port + leg_activities (arrival_port handled separately)
@@ -679,37 +728,48 @@ class TimelineGenerator:
 
         # Get leg activities - check both runtime leg and config leg
         leg_activities = self._extract_activities_from_leg(leg)
-        if not leg_activities and hasattr(self.config, "legs"):
-            for config_leg in self.config.legs:
-                if config_leg.name == leg.name and hasattr(config_leg, "activities"):
-                    leg_activities = config_leg.activities
-                    break
+        if not leg_activities:
+            config_leg = self._find_config_leg(leg.name)
+            leg_activities = getattr(config_leg, "activities", None)
 
         scientific_activities.extend(leg_activities or [])
 
+        # Create all operations first so the transit distances between
+        # consecutive ones can be computed in one batch
+        operations = []
+        for activity in scientific_activities:
+            try:
+                operations.append(self._create_operation_from_activity(activity, leg))
+            except Exception:
+                activity_name = getattr(activity, "name", str(activity))
+                logger.exception(f"Failed to process activity '{activity_name}'")
+
+        transit_distances_km = self._batch_transit_distances(operations)
+
         previous_operation = None
 
         # Process departure port and all scientific activities
-        for activity in scientific_activities:
+        for i, operation in enumerate(operations):
+            # Batched distance only applies if the preceding operation was added
+            distance_km = (
+                transit_distances_km[i - 1]
+                if i > 0 and previous_operation is operations[i - 1]
+                else None
+            )
             try:
-                operation = self._create_operation_from_activity(activity, leg)
                 self._add_transit_and_operation(
-                    operation, activities, leg, previous_operation
+                    operation, activities, leg, previous_operation, distance_km
                 )
                 previous_operation = operation
             except Exception:
-                activity_name = getattr(activity, "name", str(activity))
-                logger.exception(f"Failed to process activity '{activity_name}'")
+                logger.exception(f"Failed to process activity '{operation.name}'")
                 continue
 
         # Insert buffer time contingency block after last scientific station,
         # before the return transit to arrival port
         buffer_time = getattr(leg, "buffer_time", None)
         if buffer_time and previous_operation is not None:
-            buffer_activity = self._create_buffer_activity(
-                leg, previous_operation, buffer_time
-            )
-            activities.append(buffer_activity)
+            activities.append(self._buffer_fields(leg, previous_operation, buffer_time))
 
         # Process arrival port (transit computed from current_time, which includes buffer)
         try:
@@ -720,7 +780,7 @@ class TimelineGenerator:
         except Exception:
             logger.exception("Failed to process arrival port")
 
-        return activities
+        return self._materialize_activities(activities)
 
     def _create_buffer_activity(
         self, leg: Any, last_operation: Any, duration_minutes: float
@@ -741,33 +801,76 @@ class TimelineGenerator:
         ActivityRecord
             A stationary buffer record; advances ``self.current_time`` by duration.
         """
-        _, exit_pt = last_operation.get_coordinates()
-
-        buffer_start = self.current_time
-        buffer_end = buffer_start + timedelta(minutes=duration_minutes)
-
-        activity = ActivityRecord(
-            {
-                "activity": "Buffer",
-                "label": f"Contingency ({duration_minutes:.0f} min)",
-                "entry_lat": exit_pt.latitude,
-                "entry_lon": exit_pt.longitude,
-                "exit_lat": exit_pt.latitude,
-                "exit_lon": exit_pt.longitude,
-                "start_time": buffer_start,
-                "end_time": buffer_end,
-                "duration_minutes": duration_minutes,
-                "dist_nm": 0.0,
-                "vessel_speed_kt": 0.0,
-                "leg_name": leg.name,
-                "op_type": "buffer",
-                "operation_class": "Buffer",
-                "comment": "Weather/operational contingency buffer",
-            }
-        )
+        return self._materialize_activities(
+            [self._buffer_fields(leg, last_operation, duration_minutes)]
+        )[0]
 
-        self.current_time = buffer_end
-        return activity
+    def _buffer_fields(
+        self, leg: Any, last_operation: Any, duration_minutes: float
+    ) -> dict[str, Any]:
+        """Activity fields (without times) for a contingency buffer block."""
+        exit_lat, exit_lon = last_operation.get_exit_point()
+
+        return {
+            "activity": "Buffer",
+            "label": f"Contingency ({duration_minutes:.0f} min)",
+            "entry_lat": exit_lat,
+            "entry_lon": exit_lon,
+            "exit_lat": exit_lat,
+            "exit_lon": exit_lon,
+            "duration_minutes": duration_minutes,
+            "dist_nm": 0.0,
+            "vessel_speed_kt": 0.0,
+            "leg_name": leg.name,
+            "op_type": "buffer",
+            "operation_class": "Buffer",
+            "comment": "Weather/operational contingency buffer",
+        }
+
+    def _materialize_activities(
+        self, activities: list[dict[str, Any]]
+    ) -> list[ActivityRecord]:
+        """
+        Assign start/end times to activity fields and build the records.
+
+        Delays and durations are interleaved into one array whose running sum
+        (seeded with the elapsed minutes) yields every start and end offset, so
+        datetimes are only created once per record. Advances ``current_time``.
+
+        Parameters
+        ----------
+        activities : list of dict
+            Activity fields in schedule order, each with ``duration_minutes``
+            and optionally ``delay_start`` (minutes).
+
+        Returns
+        -------
+        list of ActivityRecord
+            Records with ``start_time`` and ``end_time`` set.
+        """
+        if not activities:
+            return []
+
+        steps = np.empty(2 * len(activities) + 1)
+        steps[0] = self._elapsed_minutes
+        steps[1::2] = [fields.get("delay_start") or 0.0 for fields in activities]
+        steps[2::2] = [fields["duration_minutes"] for fields in activities]
+        bounds = np.cumsum(steps)
+        self._elapsed_minutes = float(bounds[-1])
+
+        anchor = self._start_time
+        return [
+            ActivityRecord(
+                {
+                    **fields,
+                    "start_time": anchor + timedelta(minutes=start),
+                    "end_time": anchor + timedelta(minutes=end),
+                }
+            )
+            for fields, start, end in zip(
+                activities, bounds[1::2].tolist(), bounds[2::2].tolist(), strict=True
+            )
+        ]
 
     def _create_operation_from_activity(self, activity, leg: Any):
         """Create operation object from activity definition."""
@@ -810,126 +913,132 @@ class TimelineGenerator:
                 f"Expected PointDefinition, LineDefinition, or AreaDefinition, got {activity}"
             )
 
+    @staticmethod
+    def _batch_transit_distances(operations: list[BaseOperation]) -> list[float]:
+        """Straight-line distances (km) from each operation's exit to the next entry."""
+        return paired_distances(
+            [operation.get_exit_point() for operation in operations[:-1]],
+            [operation.get_entry_point() for operation in operations[1:]],
+        )
+
     def _add_transit_and_operation(
-        self, operation, activities, leg: Any, previous_operation
+        self,
+        operation,
+        activities,
+        leg: Any,
+        previous_operation,
+        distance_km: float | None = None,
     ):
         """Add navigational transit and operation to activities list."""
         # Add navigational transit between all operations
         if previous_operation is not None:
-            transit = self._create_navigational_transit(
-                previous_operation, operation, leg.name, leg
+            transit = self._transit_fields(
+                previous_operation, operation, leg.name, leg, distance_km
             )
             if transit:
                 activities.append(transit)
 
         # Add the operation activity
-        operation_activity = self._create_operation_activity(operation, leg.name)
-        activities.append(operation_activity)
+        activities.append(self._operation_fields(operation, leg.name))
 
-    def _create_navigational_transit(
+    def _transit_fields(
         self,
         from_op: BaseOperation,
         to_op: BaseOperation,
         leg_name: str = "unknown",
         leg: Any = None,
-    ) -> ActivityRecord | None:
-        """Create navigational transit between operations."""
+        distance_km: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Activity fields (without times) for a transit between operations."""
+        # Co-located operations need no transit record
+        if distance_km == 0.0:
+            return None
+
         # Get leg-specific vessel speed if available
         leg_vessel_speed = None
         if leg and hasattr(leg, "vessel_speed"):
             leg_vessel_speed = leg.vessel_speed
 
         transit = NavigationalTransit(
-            from_op, to_op, self.config, leg_name, vessel_speed=leg_vessel_speed
+            from_op,
+            to_op,
+            self.config,
+            leg_name,
+            vessel_speed=leg_vessel_speed,
+            distance_km=distance_km,
         )
 
         # Create rules object for calculate_duration
-        rules = type("Rules", (), {"config": self.config})()
+        rules = _DurationRules(self.config)
         duration_minutes = transit.calculate_duration(rules)
 
         # Skip zero-distance transits
         if duration_minutes <= 0:
             return None
 
-        entry_pt, exit_pt = transit.get_coordinates()
-        activity = ActivityRecord(
-            {
-                "activity": "Transit",
-                "label": transit.get_label(),
-                "entry_lat": entry_pt.latitude,
-                "entry_lon": entry_pt.longitude,
-                "exit_lat": exit_pt.latitude,
-                "exit_lon": exit_pt.longitude,
-                "operation_depth": None,
-                "water_depth": None,
-                "start_time": self.current_time,
-                "end_time": self.current_time + timedelta(minutes=duration_minutes),
-                "duration_minutes": duration_minutes,
-                "dist_nm": transit.get_operation_distance_nm(),
-                "vessel_speed_kt": transit.get_vessel_speed(),
-                "leg_name": leg_name,
-                "op_type": "transit",
-                "operation_class": transit.__class__.__name__,
-            }
-        )
-
-        self.current_time = activity.end_time
-        return activity
+        # Plain (lat, lon) tuples: no GeoPoint models are needed for the record
+        entry_lat, entry_lon = transit.get_entry_point()
+        exit_lat, exit_lon = transit.get_exit_point()
+        return {
+            "activity": "Transit",
+            "label": transit.get_label(),
+            "entry_lat": entry_lat,
+            "entry_lon": entry_lon,
+            "exit_lat": exit_lat,
+            "exit_lon": exit_lon,
+            "operation_depth": None,
+            "water_depth": None,
+            "duration_minutes": duration_minutes,
+            "dist_nm": transit.get_operation_distance_nm(),
+            "vessel_speed_kt": transit.get_vessel_speed(),
+            "leg_name": leg_name,
+            "op_type": "transit",
+            "operation_class": transit.__class__.__name__,
+        }
 
-    def _create_operation_activity(
+    def _operation_fields(
         self, operation: BaseOperation, leg_name: str = "unknown"
-    ) -> ActivityRecord:
-        """Create activity record for a scientific operation."""
-        entry_pt, exit_pt = operation.get_coordinates()
+    ) -> dict[str, Any]:
+        """Activity fields (without times) for a scientific operation."""
+        entry_lat, entry_lon = operation.get_entry_point()
+        exit_lat, exit_lon = operation.get_exit_point()
 
         # Create rules object for calculate_duration
-        rules = type("Rules", (), {"config": self.config})()
+        rules = _DurationRules(self.config)
         duration_minutes = operation.calculate_duration(rules)
 
         # Apply delay_start if specified
-        delay_start_minutes = getattr(operation, "delay_start", 0.0) or 0.0
-        actual_start_time = self.current_time + timedelta(minutes=delay_start_minutes)
-
-        activity = ActivityRecord(
-            {
-                "activity": operation.get_operation_type(),
-                "label": operation.get_label(),
-                "entry_lat": entry_pt.latitude,
-                "entry_lon": entry_pt.longitude,
-                "exit_lat": exit_pt.latitude,
-                "exit_lon": exit_pt.longitude,
-                "operation_depth": getattr(operation, "operation_depth", None),
-                "water_depth": getattr(operation, "water_depth", None),
-                # Note: depth field has mysterious issues, HTML generator should use operation_depth/water_depth directly
-                "start_time": actual_start_time,
-                "end_time": actual_start_time + timedelta(minutes=duration_minutes),
-                "duration_minutes": duration_minutes,
-                "delay_start": delay_start_minutes,
-                "comment": getattr(operation, "comment", None),
-                "dist_nm": getattr(
-                    operation, "get_operation_distance_nm", lambda: 0.0
-                )(),
-                "vessel_speed_kt": getattr(
-                    operation,
-                    "get_vessel_speed",
-                    lambda: getattr(self.config, "default_vessel_speed", 10.0),
-                )(),
-                "leg_name": leg_name,
-                "op_type": getattr(
-                    operation, "op_type", operation.get_operation_type().lower()
-                ),
-                "operation_class": operation.__class__.__name__,
-                "action": getattr(operation, "action", None)
-                and (
-                    operation.action.value
-                    if hasattr(operation.action, "value")
-                    else str(operation.action)
-                ),
-            }
+        delay_start_minutes = operation.delay_start
+
+        get_vessel_speed = getattr(operation, "get_vessel_speed", None)
+        vessel_speed_kt = (
+            get_vessel_speed()
+            if get_vessel_speed is not None
+            else getattr(self.config, "default_vessel_speed", 10.0)
         )
 
-        self.current_time = activity.end_time
-        return activity
+        return {
+            "activity": operation.get_operation_type(),
+            "label": operation.get_label(),
+            "entry_lat": entry_lat,
+            "entry_lon": entry_lon,
+            "exit_lat": exit_lat,
+            "exit_lon": exit_lon,
+            "operation_depth": operation.operation_depth,
+            "water_depth": operation.water_depth,
+            # Note: depth field has mysterious issues, HTML generator should use operation_depth/water_depth directly
+            "duration_minutes": duration_minutes,
+            "delay_start": delay_start_minutes,
+            "comment": operation.comment,
+            "dist_nm": operation.get_operation_distance_nm(),
+            "vessel_speed_kt": vessel_speed_kt,
+            "leg_name": leg_name,
+            "op_type": getattr(
+                operation, "op_type", operation.get_operation_type().lower()
+            ),
+            "operation_class": operation.__class__.__name__,
+            "action": _enum_value(operation.action),
+        }
 
     def _extract_activities_from_operations(self, leg: Any) -> list[str]:
         """Extract activities from leg operations."""
@@ -959,18 +1068,24 @@ class TimelineGenerator:
     def _extract_activities_from_config_leg(self, leg: Any) -> list[str]:
         """Extract activities from matching config leg."""
         activities = []
-        if hasattr(self.config, "legs"):
-            for config_leg in self.config.legs:
-                if config_leg.name == leg.name:
-                    if hasattr(config_leg, "clusters") and config_leg.clusters:
-                        activities.extend(
-                            self._extract_activities_from_clusters(config_leg.clusters)
-                        )
-                    elif hasattr(config_leg, "activities") and config_leg.activities:
-                        activities.extend(config_leg.activities)
-                    break
+        config_leg = self._find_config_leg(leg.name)
+        if config_leg is not None:
+            if hasattr(config_leg, "clusters") and config_leg.clusters:
+                activities.extend(
+                    self._extract_activities_from_clusters(config_leg.clusters)
+                )
+            elif hasattr(config_leg, "activities") and config_leg.activities:
+                activities.extend(config_leg.activities)
         return activities
 
+    def _find_config_leg(self, name: str) -> Any | None:
+        """Config leg definition with the given name (first match), or None."""
+        if self._config_legs is None:
+            self._config_legs = {}
+            for config_leg in getattr(self.config, "legs", None) or []:
+                self._config_legs.setdefault(config_leg.name, config_leg)
+        return self._config_legs.get(name)
+
     def _extract_activities_from_leg(self, leg: Any) -> list[str]:
         """Extract activity names from leg definition."""
         # Try runtime leg operations first
@@ -993,13 +1108,7 @@ class TimelineGenerator:
     def _parse_start_datetime(self) -> datetime:
         """Parse start datetime from config."""
         try:
-            start_date = getattr(self.config, "start_date", "1970-01-01T00:00:00+00:00")
-            if "T" in start_date:
-                start_date_clean = start_date.replace("Z", "").replace("+00:00", "")
-                return datetime.fromisoformat(start_date_clean)
-            else:
-                start_time = getattr(self.config, "start_time", "08:00")
-                return datetime.strptime(f"{start_date} {start_time}", "%Y-%m-%d %H:%M")
+            return self.config.start_datetime
         except (ValueError, AttributeError):
             logger.exception("Invalid start_date or start_time format")
             # Return a default datetime instead of None
@@ -1040,6 +1149,78 @@ def generate_timeline(cruise, legs: list[Any] | None = None) -> CruiseSchedule:
     return generator.generate_timeline(legs)
 
 
+def iter_timeline(cruise, legs: list[Any] | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Stream cruise timeline activities from a CruiseInstance object.
+
+    Yields the same activity dictionaries as :func:`generate_timeline`, but
+    without holding the whole schedule in memory; useful for callers that
+    only aggregate or filter activities.
+
+    Parameters
+    ----------
+    cruise : cruiseplan.core.cruise.CruiseInstance
+        CruiseInstance object with enhanced data
+    legs : Optional[List[Any]]
+        Runtime legs (if None, will be created from config)
+
+    Yields
+    ------
+    Dict[str, Any]
+        Timeline activities as dictionaries, in schedule order
+    """
+    return TimelineGenerator(cruise.config).iter_timeline(legs)
+
+
+# ActivityRecord fields exported as float columns (None becomes NaN)
+_NUMERIC_COLUMNS = frozenset(
+    {
+        "entry_lat",
+        "entry_lon",
+        "exit_lat",
+        "exit_lon",
+        "duration_minutes",
+        "dist_nm",
+        "vessel_speed_kt",
+        "transit_dist_nm",
+        "operation_depth",
+        "water_depth",
+        "delay_start",
+    }
+)
+
+
+def timeline_columns(timeline: CruiseSchedule) -> dict[str, np.ndarray]:
+    """
+    Convert a timeline to column-oriented NumPy arrays.
+
+    Consumers that work on whole columns (plots, NetCDF/pandas export)
+    can read contiguous arrays instead of gathering one field per activity.
+
+    Parameters
+    ----------
+    timeline : CruiseSchedule
+        Timeline activities as produced by :func:`generate_timeline`.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        One array per ActivityRecord field, in schedule order. Numeric
+        fields are float64 with NaN for missing values, ``start_time`` and
+        ``end_time`` are ``datetime64[us]``, other fields are object arrays.
+    """
+    columns = {}
+    for field in ActivityRecord.__dataclass_fields__:
+        values = [activity.get(field) for activity in timeline]
+        if field in _NUMERIC_COLUMNS:
+            columns[field] = np.array(values, dtype=np.float64)
+        elif field in ("start_time", "end_time"):
+            columns[field] = np.array(values, dtype="datetime64[us]")
+        else:
+            columns[field] = np.array(values, dtype=object)
+    return columns
+
+
 def generate_cruise_schedule(
     config_path: str,
     output_dir: str = "data",
@@ -19,11 +19,48 @@ used by API functions to ensure consistent error handling across the package.
 """
 
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class OutputPaths:
+    """
+    Output file paths shared by the enrich, map and process steps.
+
+    Built once from the output directory and base filename so that every
+    step names its files the same way.
+    """
+
+    output_dir: Path
+    """Resolved output directory."""
+
+    base_name: str
+    """Filename stem used for all outputs."""
+
+    enriched: Path = field(init=False)
+    """Enriched configuration YAML (``<base_name>_enriched.yaml``)."""
+
+    map_png: Path = field(init=False)
+    """PNG cruise map (``<base_name>_map.png``)."""
+
+    map_kml: Path = field(init=False)
+    """KML catalog (``<base_name>_catalog.kml``)."""
+
+    def __post_init__(self) -> None:
+        """Derive the output file paths from ``output_dir`` and ``base_name``."""
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        for name, suffix in (
+            ("enriched", "_enriched.yaml"),
+            ("map_png", "_map.png"),
+            ("map_kml", "_catalog.kml"),
+        ):
+            path = self.output_dir / f"{self.base_name}{suffix}"
+            object.__setattr__(self, name, path)
+
+
 def validate_input_file(file_path: str | Path, must_exist: bool = True) -> Path:
     """
     Validate and resolve an input file path for API operations.
@@ -196,27 +233,41 @@ def setup_output_paths(
     except ValueError as e:
         raise ValueError(f"Output directory setup failed: {e}")
 
-    # Determine base filename
+    return output_dir_path, derive_base_name(config_file, output)
+
+
+def derive_base_name(config_file: str | Path, output: str | None = None) -> str:
+    """
+    Determine the base filename for outputs derived from a config file.
+
+    Parameters
+    ----------
+    config_file : Union[str, Path]
+        Input YAML configuration file
+    output : str, optional
+        Explicit base filename; returned unchanged when given
+
+    Returns
+    -------
+    str
+        ``output`` if given, else the YAML ``cruise_name`` or, failing that,
+        the config file stem, with spaces and slashes made filename-safe
+    """
     if output:
-        base_name = output
-    else:
-        # Try to get cruise name from YAML content, fallback to filename
-        try:
-            import yaml
-
-            with open(config_file) as f:
-                config_data = yaml.safe_load(f)
-                cruise_name = config_data.get("cruise_name")
-                if cruise_name:
-                    # Use cruise name with safe character replacement
-                    base_name = str(cruise_name).replace(" ", "_").replace("/", "-")
-                else:
-                    # Fallback to config file stem
-                    base_name = (
-                        Path(config_file).stem.replace(" ", "_").replace("/", "-")
-                    )
-        except (FileNotFoundError, yaml.YAMLError, KeyError):
-            # Fallback to config file stem if YAML reading fails
-            base_name = Path(config_file).stem.replace(" ", "_").replace("/", "-")
-
-    return output_dir_path, base_name
+        return output
+
+    # Try to get cruise name from YAML content, fallback to filename
+    try:
+        import yaml
+
+        with open(config_file) as f:
+            config_data = yaml.safe_load(f)
+            cruise_name = config_data.get("cruise_name")
+            if cruise_name:
+                # Use cruise name with safe character replacement
+                return str(cruise_name).replace(" ", "_").replace("/", "-")
+    except (FileNotFoundError, yaml.YAMLError, KeyError):
+        # Fallback to config file stem if YAML reading fails
+        pass
+
+    return Path(config_file).stem.replace(" ", "_").replace("/", "-")
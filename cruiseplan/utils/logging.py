@@ -7,6 +7,9 @@ multiple CLI commands and API modules for consistent logging behavior.
 
 import logging
 
+# Package logger that all cruiseplan module loggers propagate to
+_PACKAGE_LOGGER = "cruiseplan"
+
 
 def configure_logging(verbose: bool = False) -> None:
     """
@@ -22,11 +25,19 @@ def configure_logging(verbose: bool = False) -> None:
 
     Notes
     -----
-    Uses a consistent format: "%(levelname)s: %(message)s"
-    Forces reconfiguration with force=True to override any existing config.
+    Only the "cruiseplan" package logger is configured; the root logger and
+    any handlers installed by the caller are left untouched. A stream handler
+    with the format "%(levelname)s: %(message)s" is added only if no handler
+    would otherwise receive cruiseplan records, so repeated calls just update
+    the level.
     """
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(levelname)s: %(message)s", force=True)
+    package_logger = logging.getLogger(_PACKAGE_LOGGER)
+    package_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    if not package_logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        package_logger.addHandler(handler)
 
 
 def get_logger(name: str) -> logging.Logger:
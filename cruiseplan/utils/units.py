@@ -10,6 +10,7 @@ that do not change based on cruise configuration.
 SECONDS_PER_MINUTE = 60.0
 MINUTES_PER_HOUR = 60.0
 HOURS_PER_DAY = 24.0
+SECONDS_PER_DAY = 86400.0
 
 # --- Distance Conversion Constants ---
 NM_PER_KM = 0.539957  # Nautical miles per kilometer
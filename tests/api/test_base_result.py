@@ -332,6 +332,24 @@ class TestNewFunctionality:
         assert "Large coordinate file" in all_warnings
         assert "Weather data unavailable" in all_warnings
 
+    def test_results_use_slots(self, tmp_path):
+        """Result objects carry no per-instance __dict__."""
+        from cruiseplan.api.types import StationPickerResult
+
+        results = [
+            BaseResult(summary={}),
+            EnrichResult(output_file=tmp_path, files_created=[], summary={}),
+            ValidationResult(success=True, errors=[], warnings=[], summary={}),
+            ScheduleResult(timeline=None, files_created=[], summary={}),
+            PangaeaResult(stations_data=None, files_created=[], summary={}),
+            ProcessResult(config=None, files_created=[], summary={}),
+            MapResult(map_files=[], format="png", summary={}),
+            BathymetryResult(data_file=None, source="etopo2022", summary={}),
+            StationPickerResult(output_file=tmp_path, summary={}),
+        ]
+        for result in results:
+            assert not hasattr(result, "__dict__"), type(result).__name__
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
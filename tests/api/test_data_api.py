@@ -85,6 +85,19 @@ class TestBathymetryAPI:
         assert result.data_file is None
         assert result.summary["file_size_mb"] is None
 
+    @patch("cruiseplan.data.bathymetry.download_bathymetry")
+    def test_bathymetry_recreates_removed_output_dir(self, mock_download, tmp_path):
+        """Test a removed output directory is created again on the next call."""
+        mock_download.return_value = None
+        data_dir = tmp_path / "bathy"
+
+        bathymetry(output_dir=str(data_dir))
+        data_dir.rmdir()
+        bathymetry(output_dir=str(data_dir))
+
+        assert data_dir.is_dir()
+        assert mock_download.call_count == 2
+
 
 class TestPangaeaAPI:
     """Test the pangaea API function with various modes and parameters."""
@@ -129,6 +142,35 @@ class TestPangaeaAPI:
         assert sig.parameters["merge_campaigns"].default is True
         assert sig.parameters["verbose"].default is False
 
+    def test_prepare_pangaea_config_paths(self, tmp_path):
+        """Test derived output paths on the prepared PANGAEA configuration."""
+        from cruiseplan.api.data import PangaeaPaths, _prepare_pangaea_config
+
+        config = _prepare_pangaea_config(
+            "CTD temperature", str(tmp_path), None, [50, 60], [-30, -20]
+        )
+
+        assert isinstance(config, PangaeaPaths)
+        assert config.base_name == "CTD_temperature"
+        assert config.bbox is not None
+        assert config.dois_file == tmp_path / "CTD_temperature_dois.txt"
+        assert config.stations_file == tmp_path / "CTD_temperature.pkl"
+
+    def test_single_doi_resolution_fields(self, tmp_path):
+        """Test single-DOI mode returns a named DoiResolution."""
+        from cruiseplan.api.data import DoiResolution, _process_single_doi
+        from cruiseplan.data.pangaea import PangaeaManager
+
+        dois_file = tmp_path / "single_dois.txt"
+        resolution = _process_single_doi(
+            "10.1594/PANGAEA.859930", dois_file, PangaeaManager(str(tmp_path))
+        )
+
+        assert isinstance(resolution, DoiResolution)
+        assert resolution.clean_dois == ["10.1594/PANGAEA.859930"]
+        assert resolution.generated_files == [dois_file]
+        assert dois_file.read_text().strip().endswith("10.1594/PANGAEA.859930")
+
 
 class TestPangaeaResultType:
     """Test the PangaeaResult type structure and methods."""
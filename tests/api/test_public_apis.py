@@ -3,6 +3,8 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import cruiseplan
 
 
@@ -43,7 +45,7 @@ class TestValidateAPI:
     """Test the cruiseplan.validate() API function."""
 
     @patch("cruiseplan.api.process_cruise._validate_configuration")
-    @patch("cruiseplan.utils.io.validate_input_file")
+    @patch("cruiseplan.api.process_cruise.validate_input_file")
     def test_validate_success(self, mock_file_validate, mock_validate):
         """Test successful validation."""
         mock_file_validate.return_value = Path("test.yaml")  # Mock file validation
@@ -57,7 +59,7 @@ class TestValidateAPI:
         assert result.success is True
 
     @patch("cruiseplan.api.process_cruise._validate_configuration")
-    @patch("cruiseplan.utils.io.validate_input_file")
+    @patch("cruiseplan.api.process_cruise.validate_input_file")
     def test_validate_failure(self, mock_file_validate, mock_validate):
         """Test failed validation."""
         mock_file_validate.return_value = Path("test.yaml")  # Mock file validation
@@ -70,7 +72,7 @@ class TestValidateAPI:
         assert result.success is False
 
     @patch("cruiseplan.api.process_cruise._validate_configuration")
-    @patch("cruiseplan.utils.io.validate_input_file")
+    @patch("cruiseplan.api.process_cruise.validate_input_file")
     def test_validate_custom_parameters(self, mock_file_validate, mock_validate):
         """Test validation with custom parameters."""
         mock_file_validate.return_value = Path("custom.yaml")  # Mock file validation
@@ -96,8 +98,8 @@ class TestValidateAPI:
 class TestEnrichAPI:
     """Test the cruiseplan.enrich() API function."""
 
-    @patch("cruiseplan.api.process_cruise._enrich_configuration")
-    @patch("cruiseplan.utils.io.validate_input_file")
+    @patch("cruiseplan.api.process_cruise._enrich_cruise")
+    @patch("cruiseplan.api.process_cruise.validate_input_file")
     @patch("cruiseplan.utils.io.validate_output_directory")
     def test_enrich_success(
         self, mock_validate_output, mock_validate_input, mock_enrich
@@ -109,14 +111,18 @@ class TestEnrichAPI:
         mock_validate_output.return_value = Path("data").resolve()
 
         # Mock enrichment function with proper return
-        mock_enrich.return_value = {
-            "stations_with_depths_added": 2,
-            "stations_with_coords_added": 1,
-            "sections_expanded": 0,
-            "stations_from_expansion": 0,
-            "station_defaults_added": 1,
-            "total_stations_processed": 3,
-        }
+        mock_cruise = object()
+        mock_enrich.return_value = (
+            mock_cruise,
+            {
+                "stations_with_depths_added": 2,
+                "stations_with_coords_added": 1,
+                "sections_expanded": 0,
+                "stations_from_expansion": 0,
+                "station_defaults_added": 1,
+                "total_stations_processed": 3,
+            },
+        )
 
         with (
             patch("pathlib.Path.exists", return_value=True),
@@ -137,15 +143,19 @@ class TestEnrichAPI:
         call_args = mock_enrich.call_args[1]
         assert call_args["add_coords"] is True
         assert call_args["add_depths"] is True
+        # The YAML parsed by enrich() is handed over rather than re-read
+        assert call_args["config_dict"] == {"cruise_name": "test"}
 
         # Check EnrichResult properties
         assert isinstance(result, cruiseplan.EnrichResult)
         assert result.output_file == Path("data/test_enriched.yaml").resolve()
         assert isinstance(result.files_created, list)
         assert isinstance(result.summary, dict)
+        # The enriched cruise is kept in memory for process()
+        assert result.cruise is mock_cruise
 
-    @patch("cruiseplan.api.process_cruise._enrich_configuration")
-    @patch("cruiseplan.utils.io.validate_input_file")
+    @patch("cruiseplan.api.process_cruise._enrich_cruise")
+    @patch("cruiseplan.api.process_cruise.validate_input_file")
     @patch("cruiseplan.utils.io.validate_output_directory")
     def test_enrich_custom_output(
         self, mock_validate_output, mock_validate_input, mock_enrich
@@ -157,14 +167,17 @@ class TestEnrichAPI:
         mock_validate_output.return_value = Path("/custom/path").resolve()
 
         # Mock enrichment function
-        mock_enrich.return_value = {
-            "stations_with_depths_added": 0,
-            "stations_with_coords_added": 0,
-            "sections_expanded": 0,
-            "stations_from_expansion": 0,
-            "station_defaults_added": 0,
-            "total_stations_processed": 1,
-        }
+        mock_enrich.return_value = (
+            object(),
+            {
+                "stations_with_depths_added": 0,
+                "stations_with_coords_added": 0,
+                "sections_expanded": 0,
+                "stations_from_expansion": 0,
+                "station_defaults_added": 0,
+                "total_stations_processed": 1,
+            },
+        )
 
         with (
             patch("pathlib.Path.exists", return_value=True),
@@ -194,6 +207,113 @@ class TestEnrichAPI:
             == Path("/custom/path/custom_name_enriched.yaml").resolve()
         )
 
+    def test_enrich_reports_written_size(self, tmp_path):
+        """Test output_size_bytes matches the enriched file on disk."""
+        config_file = tmp_path / "cruise.yaml"
+        config_file.write_text(
+            "cruise_name: Size Test\n"
+            "points:\n"
+            "  - name: STN_001\n"
+            "    latitude: 60.0\n"
+            "    longitude: -30.0\n"
+            "    operation_type: CTD\n"
+        )
+
+        result = cruiseplan.enrich(config_file, output_dir=str(tmp_path / "out"))
+
+        assert result.summary["output_size_bytes"] == result.output_file.stat().st_size
+        assert result.summary["output_size_bytes"] > 0
+
+    def test_enrich_without_flags_still_normalizes(self, tmp_path):
+        """Test enrich() with no operations still writes a normalized config."""
+        from cruiseplan.config.yaml_io import load_yaml
+
+        config_file = tmp_path / "cruise.yaml"
+        config_file.write_text(
+            "cruise_name: No Flags\n"
+            "points:\n"
+            "  - name: STN_001\n"
+            "    latitude: 60.0\n"
+            "    longitude: -30.0\n"
+            "    operation_type: CTD\n"
+        )
+
+        result = cruiseplan.enrich(
+            config_file,
+            output_dir=str(tmp_path / "out"),
+            add_depths=False,
+            add_coords=False,
+            expand_sections=False,
+        )
+
+        # Not a verbatim copy: the default leg required by the schema is added
+        enriched = load_yaml(result.output_file)
+        assert enriched["legs"]
+        assert result.cruise is not None
+
+    @patch("cruiseplan.api.process_cruise._enrich_cruise")
+    def test_enrich_unwritable_output_dir(self, mock_enrich, tmp_path):
+        """Test a permission failure while saving is reported as FileError."""
+        import pytest
+
+        from cruiseplan.config.exceptions import FileError
+        from cruiseplan.config.yaml_io import YAMLIOError
+
+        config_file = tmp_path / "cruise.yaml"
+        config_file.write_text("cruise_name: test\n")
+        out_file = tmp_path / "out" / "test_enriched.yaml"
+        try:
+            raise YAMLIOError("Error writing out.yaml") from PermissionError(
+                13, "Permission denied", str(out_file)
+            )
+        except YAMLIOError as e:
+            mock_enrich.side_effect = e
+
+        with pytest.raises(FileError, match="not writable"):
+            cruiseplan.enrich(config_file, output_dir=str(tmp_path / "out"))
+
+    @patch("cruiseplan.api.process_cruise._enrich_cruise")
+    def test_enrich_permission_error_outside_output_dir(self, mock_enrich, tmp_path):
+        """Test a permission failure on an input file keeps its own path."""
+        import pytest
+
+        from cruiseplan.config.exceptions import BathymetryError
+
+        config_file = tmp_path / "cruise.yaml"
+        config_file.write_text("cruise_name: test\n")
+        bathy_file = tmp_path / "bathymetry" / "gebco.nc"
+        mock_enrich.side_effect = PermissionError(
+            13, "Permission denied", str(bathy_file)
+        )
+
+        with pytest.raises(BathymetryError) as exc_info:
+            cruiseplan.enrich(config_file, output_dir=str(tmp_path / "out"))
+        assert "not writable" not in str(exc_info.value)
+        assert str(bathy_file) in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("Invalid GEBCO tile", "ValidationError"),
+            ("ETOPO grid unavailable", "BathymetryError"),
+            ("Directory vanished", "FileError"),
+        ],
+    )
+    @patch("cruiseplan.api.process_cruise._enrich_cruise")
+    def test_enrich_error_classification(
+        self, mock_enrich, message, expected, tmp_path
+    ):
+        """Test enrichment errors map to cruiseplan exceptions by keyword."""
+        config_file = tmp_path / "cruise.yaml"
+        config_file.write_text("cruise_name: test\n")
+        mock_enrich.side_effect = RuntimeError(message)
+
+        with pytest.raises(Exception) as exc_info:
+            cruiseplan.enrich(config_file, output_dir=str(tmp_path / "out"))
+
+        assert type(exc_info.value).__name__ == expected
+        assert message in str(exc_info.value)
+
 
 class TestSetupOutputPaths:
     """Test the internal setup_output_paths helper function."""
@@ -245,6 +365,80 @@ class TestSetupOutputPaths:
         assert base_name == "test"
         mock_validate.assert_called_once_with("data")
 
+    def test_output_paths(self):
+        """Test the derived output file names."""
+        from cruiseplan.utils.io import OutputPaths
+
+        paths = OutputPaths(Path("/out"), "My_Cruise")
+
+        assert paths.enriched == Path("/out/My_Cruise_enriched.yaml")
+        assert paths.map_png == Path("/out/My_Cruise_map.png")
+        assert paths.map_kml == Path("/out/My_Cruise_catalog.kml")
+
+    def test_derive_base_name(self, tmp_path):
+        """Test base name precedence: output, cruise_name, file stem."""
+        from cruiseplan.utils.io import derive_base_name
+
+        config = tmp_path / "my cruise.yaml"
+        config.write_text("cruise_name: North/South Leg\n")
+        assert derive_base_name(config, "custom") == "custom"
+        assert derive_base_name(config) == "North-South_Leg"
+
+        config.write_text("description: x\n")
+        assert derive_base_name(config) == "my_cruise"
+
+
+class TestCruiseNameHeader:
+    """Test the header-only cruise_name lookup used for result summaries."""
+
+    def test_reads_simple_and_quoted_names(self, tmp_path):
+        from cruiseplan.api.process_cruise import _read_cruise_name_header
+
+        config = tmp_path / "cruise.yaml"
+        config.write_text('# header\ncruise_name: "My Cruise"  # note\nlegs: []\n')
+        assert _read_cruise_name_header(config) == "My Cruise"
+
+        config.write_text("cruise_name: 'Single Quoted'\n")
+        assert _read_cruise_name_header(config) == "Single Quoted"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "cruise_name: Plain Name\n",
+            "cruise_name: foo#bar\n",
+            "cruise_name: Meteor-\n  2024\nlegs: []\n",
+            'cruise_name: "a\\tb"\n',
+            "cruise_name: 'it''s'\n",
+            "cruise_name: 2024\n",
+            "cruise_name: null\n",
+        ],
+    )
+    def test_matches_full_parse(self, tmp_path, text):
+        from cruiseplan.api.process_cruise import (
+            _get_cruise_name,
+            _read_cruise_name_header,
+        )
+        from cruiseplan.config.yaml_io import load_yaml_safe
+
+        config = tmp_path / "cruise.yaml"
+        config.write_text(text)
+        assert _read_cruise_name_header(config) is None
+        assert _get_cruise_name(config) == load_yaml_safe(config)["cruise_name"]
+
+    def test_falls_back_to_full_parse(self, tmp_path):
+        from cruiseplan.api.process_cruise import (
+            _get_cruise_name,
+            _read_cruise_name_header,
+        )
+
+        config = tmp_path / "cruise.yaml"
+        config.write_text("description: x\ncruise_name: >-\n  Folded Name\n")
+        assert _read_cruise_name_header(config) is None
+        assert _get_cruise_name(config) == "Folded Name"
+
+        config.write_text("description: x\n")
+        assert _get_cruise_name(config) is None
+
 
 # Note: Some API functions like schedule(), process(), pangaea(), map()
 # call multiple underlying functions and have more complex workflows.
@@ -2,6 +2,7 @@
 Tests for stations CLI command.
 """
 
+import logging
 from argparse import Namespace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -19,7 +20,7 @@ class TestPangaeaDataLoading:
     """Test PANGAEA data loading for stations."""
 
     @patch("cruiseplan.data.pangaea.load_campaign_data")
-    def test_load_pangaea_data_success(self, mock_load):
+    def test_load_pangaea_data_success(self, mock_load, caplog):
         """Test successful PANGAEA data loading."""
         mock_data = [
             {
@@ -31,10 +32,12 @@ class TestPangaeaDataLoading:
         ]
         mock_load.return_value = mock_data
 
-        result = load_pangaea_campaign_data(Path("test.pkl"))
+        with caplog.at_level(logging.INFO, logger="cruiseplan.api.stations_api"):
+            result = load_pangaea_campaign_data(Path("test.pkl"))
 
         assert result == mock_data
         mock_load.assert_called_once()
+        assert "Loaded 2 campaigns with 3 total stations" in caplog.text
 
     @patch("cruiseplan.data.pangaea.load_campaign_data")
     def test_load_pangaea_data_empty(self, mock_load):
@@ -82,6 +85,10 @@ class TestCoordinateBounds:
         assert lon_bounds[0] < -20.0  # Min with padding
         assert lon_bounds[1] > -15.0  # Max with padding
 
+        # 10% padding of the combined extent across campaigns
+        assert lat_bounds == pytest.approx((49.5, 55.5))
+        assert lon_bounds == pytest.approx((-20.5, -14.5))
+
     def test_determine_bounds_defaults(self):
         """Test falling back to default bounds."""
         lat_bounds, lon_bounds = determine_coordinate_bounds(
@@ -194,6 +201,12 @@ class TestMainCommand:
         mock_picker_class.assert_called_once()
         mock_picker.show.assert_called_once()
 
+        # Bounds go to the constructor; no second bathymetry render afterwards
+        kwargs = mock_picker_class.call_args.kwargs
+        assert kwargs["xlim"] == (-20.0, -10.0)
+        assert kwargs["ylim"] == (50.0, 60.0)
+        mock_picker._plot_bathymetry.assert_not_called()
+
     def test_main_no_matplotlib(self, tmp_path):
         """Test main command fails gracefully without matplotlib."""
 
@@ -304,6 +317,21 @@ class TestEdgeCases:
         assert lat_bounds == (45.0, 70.0)
         assert lon_bounds == (-65.0, -5.0)
 
+    def test_determine_bounds_ignores_missing_values(self):
+        """Test NaN gaps in PANGAEA coordinates are skipped."""
+        nan = float("nan")
+        campaign_data = [
+            {"latitude": [50.0, nan, 55.0], "longitude": [-20.0, -15.0, nan]},
+            {"latitude": [nan], "longitude": [nan]},  # All missing
+        ]
+
+        lat_bounds, lon_bounds = determine_coordinate_bounds(
+            lat_bounds=None, lon_bounds=None, campaign_data=campaign_data
+        )
+
+        assert lat_bounds == pytest.approx((49.5, 55.5))
+        assert lon_bounds == pytest.approx((-20.5, -14.5))
+
     def test_determine_bounds_missing_coordinate_keys(self):
         """Test coordinate bounds with missing keys in PANGAEA data."""
         campaign_data = [
@@ -24,17 +24,56 @@ class TestYamlOperations:
         result = load_yaml(yaml_file)
         assert result == config
 
+    def test_load_yaml_non_ascii_and_encoding(self, tmp_path):
+        """Test loading honours the file encoding and keeps comments."""
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_bytes("# Fahrt\ncruise_name: Tromsø Überfahrt\n".encode())
+
+        result = load_yaml(yaml_file)
+        assert result["cruise_name"] == "Tromsø Überfahrt"
+        assert result.ca.comment is not None
+
+        yaml_file.write_bytes("cruise_name: Tromsø\n".encode("latin-1"))
+        assert load_yaml(yaml_file, encoding="latin-1")["cruise_name"] == "Tromsø"
+
     def test_save_yaml(self, tmp_path):
         """Test saving YAML config."""
         config = {"cruise_name": "Test Cruise"}
         yaml_file = tmp_path / "output.yaml"
 
-        save_yaml(config, yaml_file, backup=False)
+        size = save_yaml(config, yaml_file, backup=False)
 
         assert yaml_file.exists()
+        assert size == yaml_file.stat().st_size
         loaded = load_yaml(yaml_file)
         assert loaded == config
 
+    def test_save_yaml_backup(self, tmp_path):
+        """Test backups keep the previous file byte-for-byte."""
+        yaml_file = tmp_path / "output.yaml"
+        original = "# Fahrt\ncruise_name: Tromsø\n".encode()
+        yaml_file.write_bytes(original)
+
+        save_yaml({"cruise_name": "New"}, yaml_file, backup=True)
+        save_yaml({"cruise_name": "Newer"}, yaml_file, backup=True)
+
+        assert (tmp_path / "output.yaml-1").read_bytes() == original
+        assert load_yaml(tmp_path / "output.yaml-2") == {"cruise_name": "New"}
+        assert load_yaml(yaml_file) == {"cruise_name": "Newer"}
+
+    def test_save_yaml_round_trip_encoding(self, tmp_path):
+        """Test saving keeps comments and writes in the requested encoding."""
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_bytes("# Fahrt\ncruise_name: Tromsø  # Name\n".encode())
+
+        save_yaml(load_yaml(yaml_file), tmp_path / "utf8.yaml")
+        assert (tmp_path / "utf8.yaml").read_bytes() == yaml_file.read_bytes()
+
+        save_yaml({"cruise_name": "Tromsø"}, tmp_path / "l1.yaml", encoding="latin-1")
+        assert (tmp_path / "l1.yaml").read_bytes() == "cruise_name: Tromsø\n".encode(
+            "latin-1"
+        )
+
 
 class TestUtilityFunctions:
     """Test utility functions."""
@@ -1,4 +1,5 @@
 # Note: You need to mock the Path object used inside the Manager constructor
+import os
 import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
@@ -194,6 +195,54 @@ def test_get_grid_subset_real_mode(real_mode_manager):
     assert yy[2, 2] == 44.0  # Last latitude (at index 4 in original array)
 
 
+def test_get_grid_subset_grid_cache(mock_netcdf_data, tmp_path):
+    """Cached grids are read back from disk and keyed on the source mtime."""
+    source_file = tmp_path / bathy_module.ETOPO_FILENAME
+    source_file.touch()
+    manager = bathy_module.BathymetryManager(source="etopo2022", data_dir=tmp_path)
+    manager._dataset = mock_netcdf_data
+    manager._lats = mock_netcdf_data.variables["lat"]
+    manager._lons = mock_netcdf_data.variables["lon"]
+    manager._file_path = source_file
+    manager._is_mock = False
+    bounds = (40.0, 44.0001, -50.0, -45.9999)
+    z_var = mock_netcdf_data.variables["z"]
+    cache_dir = tmp_path / "grid_cache"
+
+    _, _, expected = manager.get_grid_subset(*bounds, stride=2)
+
+    manager.grid_cache = True
+    manager.get_grid_subset(*bounds, stride=2)
+    assert len(list(cache_dir.glob("*.npy"))) == 1
+    reads = z_var.__getitem__.call_count
+
+    # Disk hit
+    _, _, zz = manager.get_grid_subset(*bounds, stride=2)
+    assert z_var.__getitem__.call_count == reads
+    np.testing.assert_array_equal(zz, expected)
+
+    # A modified source file is not served from the old cache entry
+    stat = source_file.stat()
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    manager.get_grid_subset(*bounds, stride=2)
+    assert z_var.__getitem__.call_count == reads + 1
+
+
+def test_prune_grid_cache_keeps_most_recent(tmp_path):
+    """Pruning deletes the least recently used grid files beyond the limit."""
+    for i in range(4):
+        path = tmp_path / f"grid_{i}.npy"
+        path.touch()
+        os.utime(path, (i, i))
+
+    bathy_module._prune_grid_cache(tmp_path, max_files=2)
+
+    assert sorted(p.name for p in tmp_path.glob("*.npy")) == [
+        "grid_2.npy",
+        "grid_3.npy",
+    ]
+
+
 def test_close_method(real_mode_manager, mock_netcdf_data):
     """Ensure the close method is called on the NetCDF dataset."""
     real_mode_manager.close()
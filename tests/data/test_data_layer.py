@@ -1,6 +1,7 @@
 import pickle
 from unittest.mock import MagicMock, mock_open, patch
 
+import numpy as np
 import pytest
 
 # Import the function under test
@@ -78,6 +79,13 @@ def test_doi_cleaning():
     assert manager._clean_doi("bad_doi") == ""
 
 
+def test_doi_batch_cleaning():
+    manager = PangaeaManager()
+    raw = ["doi:10.1594/PANGAEA.1", "https://doi.org/10.1000/1", "bad_doi"]
+    assert manager._clean_dois(raw) == ["10.1594/PANGAEA.1", "10.1000/1", ""]
+    assert manager._clean_dois([]) == []
+
+
 def test_missing_event_attribute():
     """Verify safe_get works on partial objects."""
     manager = PangaeaManager()
@@ -163,7 +171,7 @@ def test_merge_campaign_tracks_logic():
     # Check Cruise-A (The merged one)
     cruise_a = next(d for d in merged if d["label"] == "Cruise-A")
     assert len(cruise_a["latitude"]) == 3  # 2 + 1 points
-    assert cruise_a["latitude"] == [10.0, 11.0, 12.0]
+    assert cruise_a["latitude"].tolist() == [10.0, 11.0, 12.0]
     assert set(cruise_a["dois"]) == {"doi:1", "doi:2"}  # DOIs preserved
 
     # Check Cruise-B (The standalone one)
@@ -171,6 +179,20 @@ def test_merge_campaign_tracks_logic():
     assert len(cruise_b["latitude"]) == 1
 
 
+def test_merge_campaign_tracks_accepts_arrays():
+    """Arrays, lists and scalars are concatenated into float64 arrays."""
+    raw_data = [
+        {"label": "A", "latitude": np.array([10.0, 11.0]), "longitude": [5.0, 6.0]},
+        {"label": "A", "latitude": np.float64(12.0), "longitude": 7.0},
+    ]
+
+    merged = merge_campaign_tracks(raw_data)
+
+    assert merged[0]["latitude"].dtype == np.float64
+    assert merged[0]["latitude"].tolist() == [10.0, 11.0, 12.0]
+    assert merged[0]["longitude"].tolist() == [5.0, 6.0, 7.0]
+
+
 def test_merge_handles_inconsistent_data():
     """Robustness check: Ignore segments where lat/lon lengths don't match."""
     bad_data = [
@@ -187,7 +209,7 @@ def test_merge_handles_inconsistent_data():
     # Depending on strategy, we either skip the bad data or the whole entry.
     # Here we assume robust code skips the bad arrays but keeps the entry if valid.
     # Since the only data was bad, the lat/lon lists should be empty.
-    assert merged[0]["latitude"] == []
+    assert merged[0]["latitude"].size == 0
 
 
 class TestLoadCampaignData:
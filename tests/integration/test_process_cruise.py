@@ -110,3 +110,95 @@ class TestProcessIntegration:
             assert bool(result) is True
             # Should have at least the enriched config file
             assert len(result.files_created) >= 1
+
+    def test_process_map_reuses_enriched_cruise(self, tmp_path):
+        """Test process() hands the in-memory enriched cruise to map()."""
+        from unittest.mock import patch
+
+        from cruiseplan.api import map_cruise
+        from cruiseplan.config.yaml_io import save_yaml
+        from cruiseplan.runtime.cruise import CruiseInstance
+
+        config_file = tmp_path / "test_cruise.yaml"
+        save_yaml(
+            {
+                "cruise_name": "Process Reuse Test",
+                "points": [
+                    {
+                        "name": "STN_001",
+                        "latitude": 60.0,
+                        "longitude": -30.0,
+                        "operation_type": "CTD",
+                    }
+                ],
+            },
+            config_file,
+        )
+
+        with patch.object(map_cruise, "map", wraps=map_cruise.map) as spy_map:
+            cruiseplan.process(
+                config_file=config_file,
+                output_dir=str(tmp_path),
+                format="kml",
+                depth_check=False,
+            )
+
+        assert isinstance(spy_map.call_args.kwargs["cruise"], CruiseInstance)
+
+    def test_process_output_names(self, tmp_path):
+        """Test enriched config and map outputs share the cruise-name base."""
+        from cruiseplan.config.yaml_io import save_yaml
+
+        config_file = tmp_path / "test_cruise.yaml"
+        save_yaml(
+            {
+                "cruise_name": "Process Names Test",
+                "points": [
+                    {
+                        "name": "STN_001",
+                        "latitude": 60.0,
+                        "longitude": -30.0,
+                        "operation_type": "CTD",
+                    }
+                ],
+            },
+            config_file,
+        )
+
+        result = cruiseplan.process(
+            config_file=config_file,
+            output_dir=str(tmp_path),
+            format="kml",
+            depth_check=False,
+        )
+
+        names = {Path(f).name for f in result.files_created}
+        assert names == {
+            "Process_Names_Test_enriched.yaml",
+            "Process_Names_Test_catalog.kml",
+        }
+
+    def test_process_map_includes_expanded_sections(self, tmp_path):
+        """Test process() maps the stations added by section expansion."""
+        from cruiseplan.config.yaml_io import load_yaml
+
+        fixture = Path(__file__).parent.parent / "fixtures" / "tc5_sections.yaml"
+        result = cruiseplan.process(
+            config_file=fixture,
+            output_dir=str(tmp_path / "process"),
+            format="kml",
+            depth_check=False,
+        )
+        enriched_file, kml_file = result.files_created
+
+        direct = cruiseplan.map(
+            config_file=enriched_file,
+            output_dir=str(tmp_path / "map"),
+            format="kml",
+        )
+
+        n_stations = len(load_yaml(enriched_file)["points"])
+        n_placemarks = kml_file.read_text().count("<Placemark>")
+        assert n_stations > 1
+        assert n_placemarks == n_stations
+        assert n_placemarks == direct.map_files[0].read_text().count("<Placemark>")
@@ -11,6 +11,7 @@ import sys
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from cruiseplan.api.process_cruise import enrich_configuration
@@ -20,7 +21,11 @@ from cruiseplan.config.yaml_io import load_yaml
 from cruiseplan.output.html_generator import generate_html_schedule
 from cruiseplan.output.netcdf_generator import NetCDFGenerator
 from cruiseplan.runtime.cruise import CruiseInstance
-from cruiseplan.timeline.scheduler import generate_timeline
+from cruiseplan.timeline.scheduler import (
+    generate_timeline,
+    iter_timeline,
+    timeline_columns,
+)
 
 
 class TestTC2TwoLegsIntegration:
@@ -213,6 +218,30 @@ class TestTC2TwoLegsIntegration:
         assert mooring_station.duration == DEFAULT_MOORING_DURATION_MIN
         assert mooring_station.duration == 59940.0  # 999 hours
 
+    def test_iter_timeline_streams_same_activities(self, base_config_path):
+        """Test iter_timeline yields the same activities as generate_timeline."""
+        cruise = self._get_enriched_cruise(base_config_path)
+
+        streamed = iter_timeline(cruise)
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == generate_timeline(cruise)
+
+    def test_timeline_columns_match_activities(self, base_config_path):
+        """Test timeline_columns gives one array per field in schedule order."""
+        cruise = self._get_enriched_cruise(base_config_path)
+        timeline = generate_timeline(cruise)
+
+        columns = timeline_columns(timeline)
+
+        assert all(len(column) == len(timeline) for column in columns.values())
+        assert columns["entry_lat"].dtype == np.float64
+        assert columns["entry_lat"].tolist() == [a["entry_lat"] for a in timeline]
+        assert columns["label"].tolist() == [a["label"] for a in timeline]
+        assert columns["start_time"].tolist() == [a["start_time"] for a in timeline]
+        # Missing optional values become NaN in numeric columns
+        assert np.isnan(columns["operation_depth"][0])
+
     def test_timeline_generation_with_expected_structure(self, base_config_path):
         """Test timeline generation produces expected two-leg structure."""
         cruise = self._get_enriched_cruise(base_config_path)
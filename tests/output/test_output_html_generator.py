@@ -15,6 +15,7 @@ from cruiseplan.output.html_generator import (
     _convert_decimal_to_deg_min_html,
     generate_html_schedule,
 )
+from cruiseplan.output.output_utils import format_activity_type
 from cruiseplan.timeline.scheduler import calculate_timeline_statistics
 
 
@@ -46,6 +47,14 @@ class TestConversionFunctions:
         result = _convert_decimal_to_deg_min_html(1.000001)
         assert result == "01 00.000"
 
+    def test_format_activity_type(self):
+        """Test activity type labels for listed and unlisted op_types."""
+        activity = {"op_type": "CTD", "action": "profile"}
+        assert format_activity_type(activity) == "CTD profile"
+        assert format_activity_type({"op_type": "transit"}) == "Transit"
+        assert format_activity_type({"op_type": "adcp"}) == "ADCP"
+        assert format_activity_type({"op_type": "calibration"}) == "Calibration"
+
 
 @pytest.mark.skip(
     reason="Obsolete after scheduler refactor - _calculate_summary_statistics moved to scheduler.py"
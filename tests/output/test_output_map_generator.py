@@ -723,3 +723,35 @@ class TestGenerateFoliumMap:
         # Should add multiple polylines and markers
         assert mock_folium.PolyLine.call_count == 2
         assert mock_folium.Marker.call_count == 4  # 2 start + 2 end markers
+
+    def test_generate_folium_map_merged_tracks(self, tmp_path):
+        """Test merged campaign tracks (NumPy coordinates) render to HTML."""
+        from cruiseplan.data.pangaea import merge_campaign_tracks
+
+        tracks = merge_campaign_tracks(
+            [
+                {
+                    "label": "VA176",
+                    "latitude": [60.0, 61.0],
+                    "longitude": [-30.0, -31.0],
+                    "doi": "10.1000/a",
+                },
+                {"label": "VA176", "latitude": 62.0, "longitude": -32.0},
+            ]
+        )
+        mock_eez = MagicMock()
+        mock_eez.empty = True
+
+        with patch(
+            "cruiseplan.data.eez_boundaries.load_eez_data", return_value=mock_eez
+        ) as mock_load_eez:
+            result = generate_folium_map(tracks, tmp_path / "campaigns.html")
+
+        assert result == (tmp_path / "campaigns.html").resolve()
+        assert "VA176" in result.read_text()
+        min_lon, min_lat, max_lon, max_lat = mock_load_eez.call_args.kwargs["bbox"]
+        assert min_lat < 60.0 and max_lat > 62.0
+        assert min_lon < -32.0 and max_lon > -30.0
+
+        empty = merge_campaign_tracks([{"label": "X", "latitude": [], "longitude": []}])
+        assert generate_folium_map(empty, tmp_path / "empty.html") is None
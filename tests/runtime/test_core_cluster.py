@@ -46,6 +46,23 @@ class TestCluster:
         assert len(cluster.operations) == 1
         assert cluster.operations[0] == operation
 
+    def test_cluster_add_operation_rejects_duplicate_name(self):
+        """Test adding a second operation with an existing name raises."""
+        from unittest.mock import MagicMock
+
+        import pytest
+
+        cluster = Cluster(name="Test_Cluster")
+        first = MagicMock()
+        first.name = "STN_001"
+        duplicate = MagicMock()
+        duplicate.name = "STN_001"
+        cluster.add_operation(first)
+
+        with pytest.raises(ValueError, match="already exists in cluster"):
+            cluster.add_operation(duplicate)
+        assert cluster.operations == [first]
+
     def test_cluster_boundary_management(self):
         """Test cluster boundary management for reordering constraints."""
         cluster = Cluster(
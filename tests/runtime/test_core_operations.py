@@ -365,6 +365,22 @@ class TestLineOperation:
         exit_point = op.get_exit_point()
         assert exit_point == (0.0, 0.0)
 
+    def test_route_distance_computed_once(self):
+        """Test duration and distance share one route distance calculation."""
+        route = [
+            GeoPoint(latitude=60.0, longitude=-20.0),
+            GeoPoint(latitude=61.0, longitude=-21.0),
+        ]
+        op = LineOperation(name="TRANS_001", route=route, speed=10.0)
+
+        with patch(
+            "cruiseplan.timeline.distance.route_distance", return_value=185.2
+        ) as mock_route_distance:
+            assert op.get_operation_distance_nm() == pytest.approx(100.0, rel=1e-4)
+            assert op.calculate_duration(None) == pytest.approx(600.0, rel=1e-4)
+
+        mock_route_distance.assert_called_once_with(route)
+
     def test_from_pydantic(self):
         """Test creating LineOperation from TransitDefinition."""
         # Mock GeoPoint objects
@@ -1,10 +1,12 @@
 # tests/unit/test_validation_minimal.py
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from cruiseplan.api.process_cruise import _check_cruise_metadata_raw
+from cruiseplan.config.cruise_config import CruiseConfig
 from cruiseplan.config.fields import (
     ACTION_FIELD,
     ARRIVAL_PORT_FIELD,
@@ -81,6 +83,21 @@ def test_load_and_validate_cruise():
     assert resolved_stations[3].operation_type.value == "mooring"
 
 
+def test_start_datetime_parsing():
+    """Test start_datetime parses both date formats and follows edits."""
+    config = CruiseConfig(cruise_name="Test", start_date="2025-06-01T08:30:00Z")
+    assert config.start_datetime == datetime(2025, 6, 1, 8, 30)
+    assert config.start_datetime is config.start_datetime
+
+    config.start_date = "2025-07-02"
+    config.start_time = "06:15"
+    assert config.start_datetime == datetime(2025, 7, 2, 6, 15)
+
+    config.start_date = "not a date"
+    with pytest.raises(ValueError):
+        _ = config.start_datetime
+
+
 def test_missing_reference_raises_error(tmp_path):
     """
     Edge Case: Ensure the system throws an error if we schedule
@@ -20,7 +20,7 @@ class TestEnrichConfiguration:
 
     @patch("cruiseplan.api.process_cruise.save_yaml")
     @patch("cruiseplan.data.bathymetry.BathymetryManager")
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     @patch("builtins.open")
     @patch("cruiseplan.api.process_cruise.load_yaml")
     def test_enrich_depths_only(
@@ -51,8 +51,8 @@ class TestEnrichConfiguration:
         mock_station.longitude = -40.0
         mock_cruise.point_registry = {"STN_001": mock_station}
 
-        # Mock the new enrich_depths method to return the expected set
-        mock_cruise.enrich_depths.return_value = {"STN_001"}
+        # Mock the enrich_depths method to return the expected count
+        mock_cruise.enrich_depths.return_value = 1
         mock_cruise.add_coordinate_displays.return_value = 0
         mock_cruise.add_station_defaults.return_value = 0
         mock_cruise.expand_sections.return_value = {
@@ -86,7 +86,7 @@ class TestEnrichConfiguration:
 
     @patch("cruiseplan.api.process_cruise.save_yaml")
     @patch("cruiseplan.utils.coordinates.format_ddm_comment")
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     @patch("builtins.open")
     @patch("cruiseplan.api.process_cruise.load_yaml")
     def test_enrich_coords_only(
@@ -115,7 +115,7 @@ class TestEnrichConfiguration:
         mock_cruise.point_registry = {"STN_001": mock_station}
 
         # Mock enrich methods
-        mock_cruise.enrich_depths.return_value = set()
+        mock_cruise.enrich_depths.return_value = 0
         mock_cruise.add_station_defaults.return_value = 0
         mock_cruise.expand_sections.return_value = {
             "sections_expanded": 0,
@@ -151,7 +151,7 @@ class TestEnrichConfiguration:
         # save_yaml is called once: only for output (no more temp files)
         assert mock_save_yaml.call_count == 1
 
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     @patch("builtins.open")
     @patch("cruiseplan.api.process_cruise.load_yaml")
     def test_enrich_no_changes_needed(
@@ -169,7 +169,7 @@ class TestEnrichConfiguration:
         mock_cruise.point_registry = {}
 
         # Mock enrich methods to return empty sets/dicts
-        mock_cruise.enrich_depths.return_value = set()
+        mock_cruise.enrich_depths.return_value = 0
         mock_cruise.add_coordinate_displays.return_value = 0
         mock_cruise.add_station_defaults.return_value = 0
         mock_cruise.expand_sections.return_value = {
@@ -194,6 +194,100 @@ class TestEnrichConfiguration:
         assert result["total_stations_processed"] == 0
 
 
+class TestAddCoordinateDisplays:
+    """Test the coordinate display enrichment on a cruise instance."""
+
+    @pytest.mark.parametrize(
+        ("coord_format", "position_string", "changes"),
+        [("ddm", "60 30.00'N, 030 15.00'W", 2), ("dms", None, 1)],
+    )
+    def test_position_string_by_format(self, coord_format, position_string, changes):
+        from types import SimpleNamespace
+
+        from cruiseplan.runtime.enrichment import add_coordinate_displays
+
+        point = SimpleNamespace(latitude=60.5, longitude=-30.25)
+        cruise = SimpleNamespace(
+            point_registry={"STN_001": point}, line_registry={}, area_registry={}
+        )
+
+        assert add_coordinate_displays(cruise, coord_format) == changes
+        assert getattr(point, "position_string", None) == position_string
+        assert point.latitude_decmin == "60 30.000 N"
+
+
+class TestValidationWarningCapture:
+    """Test the warning capture used while building the cruise."""
+
+    def test_captures_warnings_without_showing(self):
+        import warnings
+
+        from cruiseplan.api.process_cruise import _validation_warning_capture
+
+        with patch("warnings.showwarning") as mock_show:
+            with _validation_warning_capture() as captured:
+                warnings.warn("Port reference 'x' is missing", UserWarning)
+
+        assert captured == ["Port reference 'x' is missing"]
+        mock_show.assert_not_called()
+
+    def test_keeps_caller_filters_and_warnings_on_error(self):
+        import warnings
+
+        from cruiseplan.api.process_cruise import _validation_warning_capture
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            with pytest.raises(ValueError):
+                with _validation_warning_capture() as captured:
+                    warnings.warn("Old field name", DeprecationWarning)
+                    warnings.warn("Port reference 'x' is missing", UserWarning)
+                    raise ValueError("enrichment failed")
+
+        assert captured == ["Port reference 'x' is missing"]
+
+    def test_process_warnings_logs_single_record(self, caplog):
+        import logging
+
+        from cruiseplan.api.process_cruise import _process_warnings
+
+        with caplog.at_level(logging.WARNING, logger="cruiseplan.api.process_cruise"):
+            _process_warnings(["first\n\nsecond", "third"])
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage() == (
+            "⚠️ Configuration Warnings:\n  first\n  second\n  third\n"
+        )
+
+
+class TestMinimalPreprocessConfig:
+    """Test the minimal preprocessing applied before building the cruise."""
+
+    def test_config_with_legs_is_returned_unchanged(self):
+        from cruiseplan.api.process_cruise import _minimal_preprocess_config
+
+        config = {"cruise_name": "Test", "legs": [{"name": "Leg1"}]}
+        assert _minimal_preprocess_config(config) is config
+
+    def test_default_leg_takes_global_ports(self):
+        from cruiseplan.api.process_cruise import _minimal_preprocess_config
+        from cruiseplan.config.fields import ARRIVAL_PORT_FIELD, DEPARTURE_PORT_FIELD
+
+        config = {
+            "cruise_name": "Test",
+            DEPARTURE_PORT_FIELD: "port_a",
+            ARRIVAL_PORT_FIELD: "port_b",
+        }
+        processed = _minimal_preprocess_config(config)
+
+        assert processed["legs"][0][DEPARTURE_PORT_FIELD] == "port_a"
+        assert processed["legs"][0][ARRIVAL_PORT_FIELD] == "port_b"
+        assert DEPARTURE_PORT_FIELD not in processed
+        # Original input is left untouched
+        assert DEPARTURE_PORT_FIELD in config
+        assert "legs" not in config
+
+
 class TestValidateConfigurationFile:
     """Test the validate_configuration core function."""
 
@@ -205,7 +299,7 @@ class TestValidateConfigurationFile:
     @patch("cruiseplan.api.process_cruise.check_duplicate_names")
     @patch("cruiseplan.api.process_cruise.validate_depth_accuracy")
     @patch("cruiseplan.data.bathymetry.BathymetryManager")
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     def test_validate_success_no_depth_check(
         self,
         mock_cruise_class,
@@ -250,7 +344,7 @@ class TestValidateConfigurationFile:
     @patch("cruiseplan.api.process_cruise.check_duplicate_names")
     @patch("cruiseplan.api.process_cruise.validate_depth_accuracy")
     @patch("cruiseplan.data.bathymetry.BathymetryManager")
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     def test_validate_success_with_depth_check(
         self,
         mock_cruise_class,
@@ -295,7 +389,7 @@ class TestValidateConfigurationFile:
         # Verify that the depth validation function was called
         mock_validate_depth.assert_called_once()
 
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     def test_validate_pydantic_error(self, mock_cruise_class):
         """Test validation with Pydantic validation error."""
         from pydantic import ValidationError
@@ -324,7 +418,7 @@ class TestValidateConfigurationFile:
         assert "greater than 0" in errors[0]
         assert warnings == []
 
-    @patch("cruiseplan.runtime.cruise.CruiseInstance")
+    @patch("cruiseplan.api.process_cruise.CruiseInstance")
     def test_validate_general_error(self, mock_cruise_class):
         """Test validation with general error."""
         mock_cruise_class.side_effect = RuntimeError("File not found")
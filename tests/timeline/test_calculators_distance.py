@@ -0,0 +1,143 @@
+"""Tests for cruiseplan.timeline.distance module."""
+
+import numpy as np
+import pytest
+
+from cruiseplan.config.activities import GeoPoint
+from cruiseplan.timeline.distance import (
+    _VECTORIZE_MIN_POINTS,
+    haversine_distance,
+    haversine_distance_vector,
+    paired_distances,
+    route_distance,
+    route_segment_distances,
+    to_coords,
+)
+
+
+class TestToCoords:
+    """Test suite for to_coords function."""
+
+    def test_point_formats(self):
+        """Test GeoPoint, dict and tuple inputs give (lat, lon)."""
+        assert to_coords(GeoPoint(latitude=60.0, longitude=-30.0)) == (60.0, -30.0)
+        assert to_coords({"latitude": 60.0, "longitude": -30.0}) == (60.0, -30.0)
+        assert to_coords((60.0, -30.0)) == (60.0, -30.0)
+
+    def test_duck_typed_and_passthrough_inputs(self):
+        """Test attribute objects are read; other inputs pass through."""
+        from types import SimpleNamespace
+
+        import numpy as np
+
+        assert to_coords(SimpleNamespace(latitude=1.0, longitude=2.0)) == (1.0, 2.0)
+        partial = {"latitude": 60.0}
+        assert to_coords(partial) is partial
+        array = np.array([60.0, -30.0])
+        assert to_coords(array) is array
+
+
+class TestHaversineDistance:
+    """Test suite for haversine_distance function."""
+
+    def test_one_degree_of_latitude(self):
+        """Test one degree along a meridian is ~111.19 km."""
+        assert haversine_distance((0.0, 0.0), (1.0, 0.0)) == pytest.approx(
+            111.195, abs=1e-3
+        )
+
+    def test_antipodal_points(self):
+        """Test antipodes give half the Earth's circumference."""
+        import math
+
+        from cruiseplan.timeline.distance import R_EARTH_KM
+
+        assert haversine_distance((0.0, 0.0), (0.0, 180.0)) == pytest.approx(
+            math.pi * R_EARTH_KM
+        )
+
+    def test_same_point(self):
+        """Test zero distance between identical points."""
+        assert haversine_distance((60.0, -30.0), (60.0, -30.0)) == 0.0
+
+
+class TestHaversineDistanceVector:
+    """Test suite for haversine_distance_vector function."""
+
+    def test_matches_scalar(self):
+        """Test pairwise distances agree with the scalar formula."""
+        lats1 = np.array([0.0, 60.0, -33.9, 0.0])
+        lons1 = np.array([0.0, -30.0, 18.4, 0.0])
+        lats2 = np.array([1.0, 61.5, 51.5, 0.0])
+        lons2 = np.array([0.0, -28.0, -0.1, 180.0])
+
+        result = haversine_distance_vector(lats1, lons1, lats2, lons2)
+
+        expected = [
+            haversine_distance((la1, lo1), (la2, lo2))
+            for la1, lo1, la2, lo2 in zip(lats1, lons1, lats2, lons2, strict=True)
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_broadcasts_without_modifying_inputs(self):
+        """Test a single start point broadcasts against arrays of end points."""
+        lats2 = np.array([1.0, 2.0])
+        lons2 = np.array([0.0, 0.0])
+
+        result = haversine_distance_vector(0.0, 0.0, lats2, lons2)
+
+        assert result.shape == (2,)
+        np.testing.assert_allclose(
+            result, [haversine_distance((0.0, 0.0), (lat, 0.0)) for lat in lats2]
+        )
+        np.testing.assert_array_equal(lats2, [1.0, 2.0])
+        assert haversine_distance_vector(0.0, 0.0, 1.0, 1.0).shape == ()
+
+    def test_paired_distances(self):
+        """Test paired distances on both sides of the vectorize threshold."""
+        for n in (0, 2, _VECTORIZE_MIN_POINTS + 1):
+            starts = [(10.0 + i, 20.0 - i) for i in range(n)]
+            ends = [GeoPoint(latitude=11.0 + i, longitude=20.5) for i in range(n)]
+            expected = [
+                haversine_distance(a, b) for a, b in zip(starts, ends, strict=True)
+            ]
+            result = paired_distances(starts, ends)
+            assert isinstance(result, list)
+            assert result == pytest.approx(expected, rel=1e-12)
+
+    def test_route_segment_distances(self):
+        """Test per-segment distances on both sides of the vectorize threshold."""
+        for n in (0, 1, 3, _VECTORIZE_MIN_POINTS + 3):
+            points = [(50.0 + 0.3 * i, -40.0 + 0.7 * (i % 5)) for i in range(n)]
+            expected = [
+                haversine_distance(points[i], points[i + 1])
+                for i in range(len(points) - 1)
+            ]
+            result = route_segment_distances(points)
+            assert isinstance(result, list)
+            assert result == pytest.approx(expected, rel=1e-12)
+
+
+class TestRouteDistance:
+    """Test suite for route_distance function."""
+
+    def test_short_routes(self):
+        """Test empty, single-point and two-point routes."""
+        assert route_distance([]) == 0.0
+        assert route_distance([(60.0, -30.0)]) == 0.0
+        assert route_distance([(0.0, 0.0), (1.0, 0.0)]) == pytest.approx(
+            haversine_distance((0.0, 0.0), (1.0, 0.0))
+        )
+
+    def test_long_route_matches_segment_sum(self):
+        """Test the vectorized path agrees with summed segment distances."""
+        points = [
+            (50.0 + 0.3 * i, -40.0 + 0.7 * (i % 5))
+            for i in range(_VECTORIZE_MIN_POINTS + 5)
+        ]
+        points[3] = GeoPoint(latitude=51.0, longitude=-39.0)
+
+        expected = sum(
+            haversine_distance(points[i], points[i + 1]) for i in range(len(points) - 1)
+        )
+        assert route_distance(points) == pytest.approx(expected, rel=1e-12)
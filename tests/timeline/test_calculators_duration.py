@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import numpy as np
 import pytest
 
 from cruiseplan.config.cruise_config import CruiseConfig, PointDefinition
@@ -88,6 +89,25 @@ def test_ctd_duration_custom_rates(slow_winch_config):
     assert calc.calculate_ctd_time(600.0) == 37.5
 
 
+def test_batch_durations_match_scalar(slow_winch_config):
+    """Batched CTD and transit durations agree with the scalar methods."""
+    calc = DurationCalculator(slow_winch_config)
+
+    depths = np.array([-5.0, 0.0, 600.0, 4321.5])
+    expected = [calc.calculate_ctd_time(d) for d in depths]
+    np.testing.assert_array_equal(calc.calculate_ctd_time_batch(depths), expected)
+
+    distances = np.array([0.0, 18.52, 250.0])
+    for speed in (None, 8.5):
+        expected = [calc.calculate_transit_time(d, speed) for d in distances]
+        np.testing.assert_array_equal(
+            calc.calculate_transit_time_batch(distances, speed), expected
+        )
+    np.testing.assert_array_equal(
+        calc.calculate_transit_time_batch(distances, 0.0), np.zeros(3)
+    )
+
+
 def test_custom_day_window_wait():
     """Verify wait time respects custom daylight hours (e.g., High Latitude Summer)."""
     # Create config with LONG days (04:00 to 22:00)
@@ -170,3 +190,8 @@ def test_wait_time_day_ops(mock_config):
     arrival = datetime(2025, 1, 1, 4, 0, 0)
     wait = calc.calculate_wait_time(arrival, 120, "day")
     assert wait == 240.0
+
+    # CASE 4: Arrive at 04:30:30. Sub-hour parts count towards the wait.
+    arrival = datetime(2025, 1, 1, 4, 30, 30)
+    wait = calc.calculate_wait_time(arrival, 120, "day")
+    assert wait == 209.5
@@ -8,8 +8,6 @@ in the duration calculator that are not hit by the main test suite.
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
-import pytest
-
 from cruiseplan.timeline.duration import DurationCalculator
 
 
@@ -74,18 +72,14 @@ class TestDurationCoverageBoost:
         # Ensure default speed is used when speed_knots is None
         self.mock_config.default_vessel_speed = 12.0
 
-        # Mock km_to_nm conversion (assume 1 km = 0.539957 nm roughly)
-        with pytest.MonkeyPatch.context() as m:
-            m.setattr("cruiseplan.timeline.duration.km_to_nm", lambda x: x * 0.539957)
-
-            result = self.calculator.calculate_transit_time(100.0, speed_knots=None)
+        result = self.calculator.calculate_transit_time(100.0, speed_knots=None)
 
-            # Should use default speed of 12.0 knots
-            expected_nm = 100.0 * 0.539957
-            expected_hours = expected_nm / 12.0
-            expected_minutes = expected_hours * 60
+        # Should use default speed of 12.0 knots
+        expected_nm = 100.0 * 0.539957
+        expected_hours = expected_nm / 12.0
+        expected_minutes = expected_hours * 60
 
-            assert abs(result - expected_minutes) < 0.1
+        assert abs(result - expected_minutes) < 0.1
 
     def test_calculate_wait_time_no_window(self):
         """Test wait time with no required window (line 124)."""
@@ -33,6 +33,7 @@ def _make_operation(lat=70.0, lon=-10.0):
     exit_.latitude = lat + 0.1
     exit_.longitude = lon + 0.1
     op.get_coordinates.return_value = (entry, exit_)
+    op.get_exit_point.return_value = (exit_.latitude, exit_.longitude)
     return op
 
 
@@ -69,6 +70,19 @@ class TestCreateBufferActivity:
         gen._create_buffer_activity(_make_leg(), _make_operation(), 120.0)
         assert gen.current_time == t0 + timedelta(minutes=120.0)
 
+    def test_consecutive_buffers_accumulate_from_anchor(self):
+        gen = _make_generator()
+        t0 = gen.current_time
+        first = gen._create_buffer_activity(_make_leg(), _make_operation(), 10.5)
+        second = gen._create_buffer_activity(_make_leg(), _make_operation(), 20.25)
+        assert second.start_time == first.end_time
+        assert second.end_time == t0 + timedelta(minutes=30.75)
+
+        # Assigning current_time re-anchors the schedule
+        gen.current_time = datetime(2028, 6, 2)
+        third = gen._create_buffer_activity(_make_leg(), _make_operation(), 5.0)
+        assert third.start_time == datetime(2028, 6, 2)
+
     def test_start_and_end_times(self):
         gen = _make_generator()
         t0 = gen.current_time
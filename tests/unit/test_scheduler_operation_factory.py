@@ -0,0 +1,61 @@
+"""Unit tests for OperationFactory catalog lookups."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cruiseplan.timeline.scheduler import OperationFactory
+
+
+def _item(name, tag):
+    return SimpleNamespace(name=name, tag=tag)
+
+
+@pytest.fixture
+def factory():
+    config = SimpleNamespace(
+        points=[_item("CTD1", "point"), _item("Shared", "point")],
+        ports=[_item("Shared", "port"), _item("Harbour", "port")],
+        lines=[_item("Section", "line")],
+        areas=None,
+        default_vessel_speed=10.0,
+    )
+    return OperationFactory(config)
+
+
+@patch("cruiseplan.timeline.scheduler.LineOperation.from_pydantic")
+@patch("cruiseplan.timeline.scheduler.PointOperation.from_port")
+@patch("cruiseplan.timeline.scheduler.PointOperation.from_pydantic")
+def test_resolves_by_catalog(mock_point, mock_port, mock_line, factory):
+    """Names resolve to the right constructor; points take precedence over ports."""
+    factory.create_operation("CTD1", "Leg")
+    factory.create_operation("Shared", "Leg")
+    factory.create_operation("Harbour", "Leg")
+    factory.create_operation("Section", "Leg")
+
+    assert [c.args[0].tag for c in mock_point.call_args_list] == ["point", "point"]
+    assert mock_port.call_args.args[0].name == "Harbour"
+    mock_line.assert_called_once_with(factory.config.lines[0], 10.0)
+
+
+@patch("cruiseplan.timeline.scheduler.PointOperation.from_pydantic")
+def test_catalog_index_built_once(mock_point, factory):
+    """The name index is built on first lookup and reused afterwards."""
+    with patch.object(
+        factory, "_build_catalog_index", wraps=factory._build_catalog_index
+    ) as build:
+        factory.create_operation("CTD1", "Leg")
+        factory.create_operation("Shared", "Leg")
+
+    build.assert_called_once()
+
+
+@patch("cruiseplan.timeline.scheduler.PointOperation.from_pydantic")
+def test_repeated_name_reuses_operation(mock_point, factory):
+    """An activity referenced twice resolves to the same operation object."""
+    first = factory.create_operation("CTD1", "Leg 1")
+    second = factory.create_operation("CTD1", "Leg 2")
+
+    assert first is second
+    mock_point.assert_called_once()
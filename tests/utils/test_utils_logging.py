@@ -0,0 +1,57 @@
+"""Tests for cruiseplan.utils.logging module."""
+
+import logging
+
+import pytest
+
+from cruiseplan.utils.logging import configure_logging
+
+
+@pytest.fixture
+def package_logger():
+    """Return the cruiseplan logger and restore its state afterwards."""
+    logger = logging.getLogger("cruiseplan")
+    handlers, level, propagate = logger.handlers[:], logger.level, logger.propagate
+    logger.handlers[:] = []
+    yield logger
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+class TestConfigureLogging:
+    """Test the configure_logging function."""
+
+    def test_sets_level(self, package_logger):
+        """Test verbose selects DEBUG and the default INFO on the package logger."""
+        root_level = logging.getLogger().level
+
+        configure_logging(verbose=True)
+        assert package_logger.level == logging.DEBUG
+
+        configure_logging()
+        assert package_logger.level == logging.INFO
+        assert logging.getLogger().level == root_level
+
+    def test_installs_single_handler(self, package_logger):
+        """Test a handler is added when none is reachable, and only once."""
+        package_logger.propagate = False
+
+        configure_logging()
+        configure_logging(verbose=True)
+
+        assert len(package_logger.handlers) == 1
+
+    def test_keeps_caller_handlers(self, package_logger):
+        """Test existing root handlers are left alone and not duplicated."""
+        root = logging.getLogger()
+        user_handler = logging.NullHandler()
+        root.addHandler(user_handler)
+        try:
+            root_handlers = root.handlers[:]
+            configure_logging()
+
+            assert root.handlers == root_handlers
+            assert package_logger.handlers == []
+        finally:
+            root.removeHandler(user_handler)